@@ -0,0 +1,707 @@
+"""
+---------------------------------------------------
+------------- MÓDULO: async_exchange --------------
+---------------------------------------------------
+Dentro da proposta do pacote jaiminho, este módulo
+oferece uma alternativa assíncrona ao envio de
+e-mails realizado pelo módulo exchange. Enquanto a
+biblioteca exchangelib ocupa uma thread do sistema
+operacional para cada envio em andamento, aqui as
+requisições SOAP enviadas ao servidor Exchange (EWS)
+são construídas diretamente e transmitidas a partir
+de um client HTTP não bloqueante (aiohttp), com pool
+de conexões e keep-alive. Dessa forma, milhares de
+envios simultâneos podem ser realizados em um único
+processo a partir do event loop do asyncio.
+A autenticação é realizada exclusivamente via HTTP
+Basic. Servidores que aceitam apenas NTLM ou outros
+métodos negociados (comuns em instalações locais do
+Exchange) devem utilizar a função send_mail() do
+módulo exchange, que negocia a autenticação por meio
+da exchangelib.
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+    1.2 Definindo variáveis do módulo
+2. Construindo requisições EWS
+    2.1 Funções auxiliares
+3. Encapsulando envio assíncrono de e-mails
+    3.1 Sessão e envio de mensagens
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades do próprio pacote
+from jaiminho.exchange import get_attachment_content
+
+# Erros da biblioteca exchangelib
+from exchangelib.errors import UnauthorizedError, TransportError, \
+                               ResponseMessageError, SOAPError, ErrorServerBusy
+import exchangelib.errors
+
+# Bibliotecas gerais
+import asyncio
+from base64 import b64encode, encodebytes
+from collections import namedtuple
+from email.header import Header
+from email.utils import encode_rfc2231, quote
+from mimetypes import guess_type
+from uuid import uuid4
+from xml.sax.saxutils import escape
+from xml.etree import ElementTree
+
+# Client HTTP assíncrono (dependência opcional: pip install jaiminho[async])
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+        1.2 Definindo variáveis do módulo
+---------------------------------------------------
+"""
+
+# Namespaces utilizados nas requisições e respostas EWS
+NS_SOAP = 'http://schemas.xmlsoap.org/soap/envelope/'
+NS_MESSAGES = 'http://schemas.microsoft.com/exchange/services/2006/messages'
+NS_TYPES = 'http://schemas.microsoft.com/exchange/services/2006/types'
+NS_ERRORS = 'http://schemas.microsoft.com/exchange/services/2006/errors'
+
+# Versão do servidor solicitada nas requisições
+EWS_VERSION = 'Exchange2013_SP1'
+
+# Anexo com conteúdo pré-codificado em base64 (ver prepare_attachment())
+PreparedAttachment = namedtuple('PreparedAttachment', ['b64'])
+
+# Cabeçalhos HTTP das requisições SOAP
+EWS_HEADERS = {
+    'Content-Type': 'text/xml; charset=utf-8',
+    'Accept': 'text/xml'
+}
+
+
+"""
+---------------------------------------------------
+---------- 2. CONSTRUINDO REQUISIÇÕES EWS ---------
+               2.1 Funções auxiliares
+---------------------------------------------------
+"""
+
+# Definindo endpoint EWS a partir do servidor
+def get_ews_url(server):
+    """
+    Retorna o endpoint EWS associado ao servidor fornecido.
+    Caso o parâmetro "server" seja apenas o nome do host
+    (ex: "outlook.office365.com"), o endpoint padrão em HTTPS
+    é construído. Caso uma URL completa seja fornecida (útil,
+    por exemplo, em testes com servidores locais), esta é
+    utilizada diretamente.
+
+    Parâmetros
+    ----------
+    :param server:
+        Servidor Exchange ou URL completa do endpoint EWS.
+        [type: string]
+
+    Retorno
+    -------
+    :return url:
+        URL do endpoint EWS a ser utilizada nas requisições.
+        [type: string]
+    """
+
+    # URL completa fornecida pelo usuário
+    if server.startswith(('http://', 'https://')):
+        if server.lower().endswith('.asmx'):
+            return server
+        return server.rstrip('/') + '/EWS/Exchange.asmx'
+
+    return f'https://{server}/EWS/Exchange.asmx'
+
+# Codificando conteúdo em base64 com linhas de 76 caracteres separadas por CRLF
+def _encode_lines(content):
+    return encodebytes(content).replace(b'\n', b'\r\n')
+
+# Pré-codificando anexos em base64
+def prepare_attachment(file):
+    """
+    Lê e codifica o conteúdo de um anexo em base64 uma única vez,
+    retornando um objeto que pode ser reaproveitado em quantos
+    envios forem necessários (ex: o mesmo relatório enviado a
+    diversos destinatários). Objetos retornados por esta função
+    são aceitos como arquivos no parâmetro "zip_attachments" das
+    funções de envio deste módulo, evitando que a codificação seja
+    refeita a cada mensagem. O conteúdo é codificado em linhas de
+    76 caracteres separadas por CRLF, formato exigido no conteúdo
+    MIME (RFC 2045) e também válido no payload SOAP, sem necessidade
+    de novas cópias em cada envio.
+
+    Parâmetros
+    ----------
+    :param file:
+        Arquivo a ser anexado, nos mesmos formatos aceitos pela
+        função attach_file() do módulo exchange.
+        [type: str, bytes ou DataFrame]
+
+    Retorno
+    -------
+    :return attachment:
+        Anexo pré-codificado contendo o conteúdo em base64.
+        [type: PreparedAttachment]
+    """
+
+    content = get_attachment_content(file)
+    if content is None:
+        raise TypeError(f'Formato do parâmetro "file" ({type(file)}) inválido para anexo')
+
+    return PreparedAttachment(b64=_encode_lines(content))
+
+# Garantindo anexos pré-codificados
+def _prepare_attachments(zip_attachments, wrap=False):
+    attachments = []
+    for name, file in zip_attachments or []:
+        if type(file) is not PreparedAttachment:
+            content = get_attachment_content(file)
+            if content is None:
+                print(f'Formato do parâmetro "file" ({type(file)}) inválido. Ignorando anexo {name}')
+                continue
+            # Quebra de linhas necessária apenas no conteúdo MIME
+            b64 = _encode_lines(content) if wrap else b64encode(content)
+            file = PreparedAttachment(b64=b64)
+        attachments.append((name, file))
+
+    return attachments
+
+# Construindo conteúdo MIME da mensagem
+def build_mime_content(mail_box, mail_to, subject, body, zip_attachments=None):
+    """
+    Constrói o conteúdo MIME (multipart/mixed) de uma mensagem
+    com corpo HTML e anexos. As partes são montadas diretamente
+    em bytes, reaproveitando a codificação base64 de anexos
+    pré-codificados pela função prepare_attachment(), e unidas
+    em uma única alocação ao final.
+
+    Parâmetros
+    ----------
+    :param mail_box:
+        Caixa de e-mail remetente da mensagem.
+        [type: string]
+
+    :param mail_to:
+        Lista de destinatários da mensagem.
+        [type: list]
+
+    :param subject:
+        Título da mensagem ser enviada por e-mail.
+        [type: string]
+
+    :param body:
+        Corpo da mensagem a ser enviada por e-mail em HTML.
+        [type: string]
+
+    :param zip_attachments:
+        Elemento zipado contendo nomes e arquivos a serem
+        anexados (ver função send_mail() do módulo exchange).
+        [type: zip, default=None]
+
+    Retorno
+    -------
+    :return mime:
+        Conteúdo MIME da mensagem em bytes.
+        [type: bytes]
+    """
+
+    boundary = f'jaiminho-{uuid4().hex}'.encode('ascii')
+    # Quebras de linha CRLF exigidas pelas RFCs 5322 e 2045
+    nl = b'\r\n'
+
+    # Cabeçalhos da mensagem
+    parts = [
+        b'MIME-Version: 1.0', nl,
+        b'From: ', mail_box.encode('utf-8'), nl,
+        b'To: ', ', '.join(mail_to).encode('utf-8'), nl,
+        b'Subject: ', Header(subject, 'utf-8').encode(linesep='\r\n').encode('ascii'), nl,
+        b'Content-Type: multipart/mixed; boundary="', boundary, b'"', nl, nl,
+        b'--', boundary, nl,
+        b'Content-Type: text/html; charset="utf-8"', nl,
+        b'Content-Transfer-Encoding: base64', nl, nl,
+        _encode_lines(body.encode('utf-8'))
+    ]
+
+    # Anexos com a codificação base64 já realizada
+    for name, attachment in _prepare_attachments(zip_attachments, wrap=True):
+        content_type = guess_type(name)[0] or 'application/octet-stream'
+        # Nomes com caracteres especiais ou de controle codificados segundo a RFC 2231
+        if all(ord(c) < 128 for c in name) and name.isprintable():
+            param = f'filename="{quote(name)}"'
+        else:
+            param = f'filename*={encode_rfc2231(name, "utf-8")}'
+        parts += [
+            b'--', boundary, nl,
+            f'Content-Type: {content_type}'.encode('ascii'), nl,
+            f'Content-Disposition: attachment; {param}'.encode('ascii'), nl,
+            b'Content-Transfer-Encoding: base64', nl, nl,
+            attachment.b64
+        ]
+    parts += [b'--', boundary, b'--', nl]
+
+    return b''.join(parts)
+
+# Construindo payload SOAP da operação CreateItem
+def build_create_item_payload(mail_box, mail_to, subject, body,
+                              zip_attachments=None, raw_mime=False):
+    """
+    Constrói o envelope SOAP da operação CreateItem do EWS
+    com a disposição "SendAndSaveCopy", equivalente ao método
+    send_and_save() da classe Message da biblioteca exchangelib.
+    Em outras palavras, a mensagem é enviada e uma cópia é
+    salva na pasta de itens enviados da caixa "mail_box".
+    O payload é montado como uma lista de segmentos em bytes
+    unidos em uma única alocação ao final, de modo que o
+    conteúdo base64 dos anexos é copiado apenas uma vez.
+
+    Parâmetros
+    ----------
+    :param mail_box:
+        Caixa de e-mail utilizada como remetente da mensagem e
+        cuja pasta de itens enviados receberá a cópia salva.
+        [type: string]
+
+    :param mail_to:
+        Lista de destinatários da mensagem.
+        [type: list]
+
+    :param subject:
+        Título da mensagem ser enviada por e-mail.
+        [type: string]
+
+    :param body:
+        Corpo da mensagem a ser enviada por e-mail em HTML.
+        [type: string]
+
+    :param zip_attachments:
+        Elemento zipado contendo nomes e arquivos a serem
+        anexados, no mesmo formato aceito pela função
+        send_mail() do módulo exchange. Anexos pré-codificados
+        pela função prepare_attachment() também são aceitos.
+        [type: zip, default=None]
+
+    :param raw_mime:
+        Flag para envio da mensagem como conteúdo MIME bruto
+        (elemento MimeContent) construído pela função
+        build_mime_content(), no lugar das propriedades
+        individuais da mensagem.
+        [type: bool, default=False]
+
+    Retorno
+    -------
+    :return payload:
+        Envelope SOAP codificado em bytes (utf-8).
+        [type: bytes]
+    """
+
+    # Texto escapado e codificado para inclusão no payload
+    def text(value):
+        return escape(value).encode('utf-8')
+
+    parts = [
+        b'<?xml version="1.0" encoding="utf-8"?>',
+        f'<soap:Envelope xmlns:soap="{NS_SOAP}" xmlns:m="{NS_MESSAGES}" xmlns:t="{NS_TYPES}">'.encode('ascii'),
+        b'<soap:Header>',
+        f'<t:RequestServerVersion Version="{EWS_VERSION}"/>'.encode('ascii'),
+        b'</soap:Header>',
+        b'<soap:Body>',
+        b'<m:CreateItem MessageDisposition="SendAndSaveCopy">',
+        b'<m:SavedItemFolderId>',
+        b'<t:DistinguishedFolderId Id="sentitems">',
+        b'<t:Mailbox><t:EmailAddress>', text(mail_box), b'</t:EmailAddress></t:Mailbox>',
+        b'</t:DistinguishedFolderId>',
+        b'</m:SavedItemFolderId>',
+        b'<m:Items>',
+        b'<t:Message>'
+    ]
+
+    # Mensagem completa enviada como conteúdo MIME
+    if raw_mime:
+        mime = build_mime_content(mail_box, mail_to, subject, body, zip_attachments)
+        parts += [b'<t:MimeContent CharacterSet="UTF-8">', b64encode(mime), b'</t:MimeContent>']
+
+    # Propriedades individuais da mensagem
+    else:
+        parts += [
+            b'<t:Subject>', text(subject), b'</t:Subject>',
+            b'<t:Body BodyType="HTML">', text(body), b'</t:Body>'
+        ]
+
+        # Anexos com a codificação base64 já realizada
+        attachments = _prepare_attachments(zip_attachments)
+        if attachments:
+            parts.append(b'<t:Attachments>')
+            for name, attachment in attachments:
+                parts += [
+                    b'<t:FileAttachment>',
+                    b'<t:Name>', text(name), b'</t:Name>',
+                    b'<t:ContentId>', text(name), b'</t:ContentId>',
+                    b'<t:IsInline>false</t:IsInline>',
+                    b'<t:Content>', attachment.b64, b'</t:Content>',
+                    b'</t:FileAttachment>'
+                ]
+            parts.append(b'</t:Attachments>')
+
+        # Destinatários e remetente
+        parts.append(b'<t:ToRecipients>')
+        for address in mail_to:
+            parts += [b'<t:Mailbox><t:EmailAddress>', text(address), b'</t:EmailAddress></t:Mailbox>']
+        parts += [
+            b'</t:ToRecipients>',
+            b'<t:From><t:Mailbox><t:EmailAddress>', text(mail_box), b'</t:EmailAddress></t:Mailbox></t:From>'
+        ]
+
+    parts += [
+        b'</t:Message>',
+        b'</m:Items>',
+        b'</m:CreateItem>',
+        b'</soap:Body>',
+        b'</soap:Envelope>'
+    ]
+
+    return b''.join(parts)
+
+# Construindo exceção da exchangelib a partir de um código de resposta EWS
+def _ews_error(code, text, message_xml=None):
+    # Tempo de espera solicitado pelo servidor em caso de throttling
+    if code == 'ErrorServerBusy':
+        back_off = None
+        if message_xml is not None:
+            for value in message_xml.iter(f'{{{NS_TYPES}}}Value'):
+                if value.get('Name') == 'BackOffMilliseconds':
+                    try:
+                        back_off = int(value.text) / 1000
+                    except (TypeError, ValueError):
+                        pass
+        return ErrorServerBusy(text, back_off=back_off)
+
+    error_cls = getattr(exchangelib.errors, code, None)
+    if not (isinstance(error_cls, type) and issubclass(error_cls, Exception)):
+        return None
+    return error_cls(text)
+
+# Validando resposta do servidor
+def check_ews_response(status, content):
+    """
+    Verifica o status HTTP e o conteúdo da resposta de uma
+    requisição EWS, levantando a exceção correspondente da
+    biblioteca exchangelib em caso de falha. Os códigos de
+    resposta do EWS (ex: "ErrorServerBusy") são mapeados
+    para as classes homônimas de exchangelib.errors, de modo
+    que o tratamento de erros seja o mesmo do envio síncrono.
+    São considerados tanto os códigos das mensagens de resposta
+    quanto os retornados em um soap:Fault (HTTP 500), forma
+    utilizada pelo Exchange para throttling e erros de schema
+    ou versão. No caso de throttling, o tempo de espera
+    solicitado pelo servidor fica disponível no atributo
+    "back_off" (em segundos) da exceção ErrorServerBusy.
+
+    Parâmetros
+    ----------
+    :param status:
+        Código de status HTTP da resposta.
+        [type: int]
+
+    :param content:
+        Conteúdo da resposta em bytes.
+        [type: bytes]
+    """
+
+    # Erro de autenticação
+    if status == 401:
+        raise UnauthorizedError(f'Credenciais inválidas para o servidor EWS (status {status})')
+
+    # Procurando códigos de resposta no envelope retornado
+    try:
+        root = ElementTree.fromstring(content)
+    except ElementTree.ParseError:
+        raise TransportError(f'Resposta inválida do servidor EWS (status {status}): {content[:200]!r}')
+
+    # Falhas reportadas como soap:Fault
+    fault = root.find(f'{{{NS_SOAP}}}Body/{{{NS_SOAP}}}Fault')
+    if fault is not None:
+        faultcode = fault.findtext('faultcode', default='').strip()
+        faultstring = fault.findtext('faultstring', default='').strip()
+        detail = fault.find('detail')
+        if detail is not None:
+            code = detail.findtext(f'{{{NS_ERRORS}}}ResponseCode', default='').strip()
+            text = detail.findtext(f'{{{NS_ERRORS}}}Message', default=faultstring).strip()
+            message_xml = detail.find(f'{{{NS_TYPES}}}MessageXml')
+            # Detalhes da violação de schema complementam a mensagem
+            if code == 'ErrorSchemaValidation' and message_xml is not None:
+                violation = message_xml.findtext(f'{{{NS_TYPES}}}Violation')
+                if violation:
+                    text = f'{text} {violation}'
+            error = _ews_error(code, text, message_xml)
+            if error is not None:
+                raise error
+        error = _ews_error(faultcode.split(':')[-1], faultstring)
+        if error is not None:
+            raise error
+        raise SOAPError(f'Falha SOAP no servidor EWS (status {status}): {faultcode} {faultstring}')
+
+    for message in root.iter():
+        if message.get('ResponseClass') in ('Error', 'Warning'):
+            code = message.findtext(f'{{{NS_MESSAGES}}}ResponseCode', default='')
+            text = message.findtext(f'{{{NS_MESSAGES}}}MessageText', default=code)
+            message_xml = message.find(f'{{{NS_MESSAGES}}}MessageXml')
+            raise _ews_error(code, text, message_xml) or ResponseMessageError(text)
+
+    # Demais falhas HTTP sem código de resposta EWS
+    if status != 200:
+        raise TransportError(f'Falha na requisição ao servidor EWS (status {status})')
+
+
+"""
+---------------------------------------------------
+---- 3. ENCAPSULANDO ENVIO ASSÍNCRONO DE EMAILS ---
+          3.1 Sessão e envio de mensagens
+---------------------------------------------------
+"""
+
+# Criando sessão HTTP com pool de conexões
+def create_session(username, password, max_connections=100,
+                   keepalive_timeout=30, timeout=120):
+    """
+    Cria uma sessão HTTP assíncrona autenticada para o envio
+    de requisições ao servidor EWS. A sessão mantém um pool de
+    até "max_connections" conexões reaproveitadas via keep-alive,
+    sendo recomendado compartilhar uma mesma sessão entre todos
+    os envios de um processo. A função deve ser chamada dentro
+    de um event loop em execução. As credenciais são enviadas
+    via HTTP Basic, único método de autenticação suportado;
+    servidores que exigem NTLM responderão com UnauthorizedError.
+
+    Parâmetros
+    ----------
+    :param username:
+        Usuário de e-mail com permissões válidas de envio de
+        e-mails a partir da caixa genérica fornecida.
+        [type: string]
+
+    :param password:
+        Senha referente ao usuário "username" fornecido.
+        [type: string]
+
+    :param max_connections:
+        Número máximo de conexões simultâneas mantidas no pool.
+        [type: int, default=100]
+
+    :param keepalive_timeout:
+        Tempo (em segundos) que uma conexão ociosa é mantida
+        aberta para reaproveitamento.
+        [type: int, default=30]
+
+    :param timeout:
+        Tempo máximo (em segundos) de cada requisição.
+        [type: int, default=120]
+
+    Retorno
+    -------
+    :return session:
+        Sessão HTTP a ser fornecida às funções de envio e
+        posteriormente encerrada com "await session.close()".
+        [type: aiohttp.ClientSession]
+    """
+
+    if aiohttp is None:
+        raise ImportError('O envio assíncrono depende do pacote aiohttp. '
+                          'Instale-o com "pip install jaiminho[async]"')
+
+    connector = aiohttp.TCPConnector(
+        limit=max_connections,
+        keepalive_timeout=keepalive_timeout
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        auth=aiohttp.BasicAuth(username, password),
+        headers=EWS_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=timeout)
+    )
+
+    return session
+
+# Enviando mensagens de forma assíncrona
+async def send_mail_async(username, password, server, mail_box, mail_to,
+                          subject, body, zip_attachments=None, session=None,
+                          raw_mime=False):
+    """
+    Versão assíncrona da função send_mail() do módulo exchange.
+    Os parâmetros possuem o mesmo significado, porém a mensagem
+    é enviada por meio de uma requisição CreateItem ao EWS sem
+    bloquear o event loop. Caso nenhuma sessão seja fornecida,
+    uma sessão temporária é criada e encerrada ao final do envio;
+    para envios em massa, recomenda-se fornecer uma sessão criada
+    pela função create_session() ou utilizar send_many_async().
+
+    Parâmetros
+    ----------
+    :param username:
+        Usuário de e-mail com permissões válidas de envio.
+        [type: string]
+
+    :param password:
+        Senha referente ao usuário "username" fornecido.
+        [type: string]
+
+    :param server:
+        Servidor Exchange (ex: "outlook.office365.com") ou URL
+        completa do endpoint EWS.
+        [type: string]
+
+    :param mail_box:
+        Caixa de e-mail utilizada no envio da mensagem.
+        [type: string]
+
+    :param mail_to:
+        Lista de destinatários da mensagem.
+        [type: list]
+
+    :param subject:
+        Título da mensagem ser enviada por e-mail.
+        [type: string]
+
+    :param body:
+        Corpo da mensagem a ser enviada por e-mail em HTML.
+        [type: string]
+
+    :param zip_attachments:
+        Elemento zipado contendo nomes e arquivos a serem
+        anexados (ver função send_mail() do módulo exchange).
+        [type: zip, default=None]
+
+    :param session:
+        Sessão HTTP previamente criada via create_session().
+        [type: aiohttp.ClientSession, default=None]
+
+    :param raw_mime:
+        Flag para envio da mensagem como conteúdo MIME bruto
+        (ver função build_create_item_payload()).
+        [type: bool, default=False]
+    """
+
+    # Construindo requisição antes de abrir conexões
+    payload = build_create_item_payload(
+        mail_box=mail_box,
+        mail_to=mail_to,
+        subject=subject,
+        body=body,
+        zip_attachments=zip_attachments,
+        raw_mime=raw_mime
+    )
+
+    # Criando sessão temporária se necessário e enviando requisição
+    own_session = session is None
+    if own_session:
+        session = create_session(username=username, password=password)
+    try:
+        async with session.post(get_ews_url(server), data=payload) as response:
+            content = await response.read()
+            check_ews_response(response.status, content)
+    finally:
+        if own_session:
+            await session.close()
+
+# Enviando múltiplas mensagens de forma concorrente
+async def send_many_async(username, password, server, mail_box, messages,
+                          max_concurrency=1000, max_connections=100):
+    """
+    Envia um conjunto de mensagens de forma concorrente a partir
+    de uma única sessão HTTP. As mensagens são consumidas sob
+    demanda do iterável fornecido, de modo que no máximo
+    "max_concurrency" envios fiquem em andamento ao mesmo tempo,
+    compartilhando um pool de "max_connections" conexões.
+
+    Parâmetros
+    ----------
+    :param username:
+        Usuário de e-mail com permissões válidas de envio.
+        [type: string]
+
+    :param password:
+        Senha referente ao usuário "username" fornecido.
+        [type: string]
+
+    :param server:
+        Servidor Exchange ou URL completa do endpoint EWS.
+        [type: string]
+
+    :param mail_box:
+        Caixa de e-mail utilizada no envio das mensagens.
+        [type: string]
+
+    :param messages:
+        Iterável de dicionários contendo as chaves "mail_to",
+        "subject", "body" e, opcionalmente, "zip_attachments"
+        e "raw_mime", equivalentes aos parâmetros da função
+        send_mail_async().
+        [type: iterable]
+
+    :param max_concurrency:
+        Número máximo de envios em andamento simultaneamente.
+        [type: int, default=1000]
+
+    :param max_connections:
+        Número máximo de conexões HTTP mantidas no pool.
+        [type: int, default=100]
+
+    Retorno
+    -------
+    :return results:
+        Lista com o resultado de cada envio, na ordem das
+        mensagens fornecidas: None em caso de sucesso ou a
+        exceção levantada em caso de falha.
+        [type: list]
+    """
+
+    session = create_session(
+        username=username,
+        password=password,
+        max_connections=max_connections
+    )
+    results = []
+    iterator = enumerate(messages)
+
+    # Cada worker consome a próxima mensagem disponível do iterável
+    async def worker():
+        for idx, message in iterator:
+            results.append(None)
+            try:
+                await send_mail_async(
+                    username=username,
+                    password=password,
+                    server=server,
+                    mail_box=mail_box,
+                    session=session,
+                    **message
+                )
+            except Exception as e:
+                results[idx] = e
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+    finally:
+        await session.close()
+
+    return results
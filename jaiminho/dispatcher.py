@@ -0,0 +1,284 @@
+"""
+---------------------------------------------------
+--------------- MÓDULO: dispatcher ----------------
+---------------------------------------------------
+Dentro da proposta do pacote jaiminho, este módulo
+tem por objetivo distribuir o envio de um grande
+volume de mensagens entre múltiplas caixas de e-mail.
+Como cada caixa está sujeita aos limites de envio
+(throttling) do servidor Exchange, um processo é
+iniciado para cada credencial fornecida, contando
+com sua própria conta conectada e seu próprio limite
+de envios por segundo. As mensagens são consumidas
+sob demanda de uma fila compartilhada e o progresso
+de todos os processos é consolidado em um único
+resumo, de modo que a vazão total cresça com o
+número de caixas utilizadas.
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+2. Distribuindo envios entre processos
+    2.1 Funções auxiliares
+    2.2 Envio distribuído de mensagens
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades do próprio pacote
+from jaiminho.exchange import connect_to_exchange, create_message, attach_file
+
+# Bibliotecas gerais
+import multiprocessing
+from queue import Empty, Full
+import time
+
+
+"""
+---------------------------------------------------
+------ 2. DISTRIBUINDO ENVIOS ENTRE PROCESSOS -----
+               2.1 Funções auxiliares
+---------------------------------------------------
+"""
+
+# Enviando mensagem a partir de uma conta já conectada
+def _send_with_account(account, mail_to, subject, body, zip_attachments=None):
+    m = create_message(
+        account=account,
+        subject=subject,
+        body=body,
+        to_recipients=mail_to
+    )
+    if zip_attachments is not None:
+        for name, file in zip_attachments:
+            m = attach_file(
+                message=m,
+                file=file,
+                attachment_name=name
+            )
+    m.send_and_save()
+
+# Processo responsável pelos envios de uma única caixa de e-mail
+def _shard_worker(credentials, in_queue, out_queue, rate_limit, send_func):
+    mail_box = credentials['mail_box']
+
+    # Conta conectada uma única vez e reaproveitada em todos os envios
+    try:
+        account = connect_to_exchange(**credentials) if send_func is None else None
+    except Exception as e:
+        out_queue.put(('fatal', mail_box, None, repr(e)))
+        return
+
+    interval = 1 / rate_limit if rate_limit else 0
+    next_slot = time.monotonic()
+    while True:
+        item = in_queue.get()
+        if item is None:
+            break
+        idx, message = item
+
+        # Respeitando limite de envios por segundo da caixa
+        if interval:
+            wait = next_slot - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            next_slot = max(next_slot, time.monotonic()) + interval
+
+        try:
+            if send_func is None:
+                _send_with_account(account, **message)
+            else:
+                send_func(**credentials, **message)
+            out_queue.put(('sent', mail_box, idx, None))
+        except Exception as e:
+            out_queue.put(('failed', mail_box, idx, repr(e)))
+
+    out_queue.put(('done', mail_box, None, None))
+
+
+"""
+---------------------------------------------------
+------ 2. DISTRIBUINDO ENVIOS ENTRE PROCESSOS -----
+         2.2 Envio distribuído de mensagens
+---------------------------------------------------
+"""
+
+# Enviando mensagens distribuídas entre múltiplas caixas
+def send_sharded(credentials, messages, rate_limit=None, queue_size=1000,
+                 progress_callback=None, send_func=None):
+    """
+    Distribui o envio de um conjunto de mensagens entre múltiplos
+    processos, um para cada credencial fornecida. Cada processo
+    conecta-se uma única vez ao servidor Exchange a partir da
+    função connect_to_exchange() e consome as mensagens de uma
+    fila compartilhada, respeitando seu próprio limite de envios
+    por segundo. Como a fila possui tamanho limitado, mensagens
+    fornecidas por um gerador são consumidas sob demanda, sem a
+    necessidade de carregar todo o volume em memória. Os processos
+    são iniciados pelo método "spawn", portanto scripts que chamam
+    esta função devem protegê-la com if __name__ == '__main__'.
+    Mensagens não processadas devido ao encerramento abrupto de
+    processos são contabilizadas como falhas.
+
+    Parâmetros
+    ----------
+    :param credentials:
+        Lista de dicionários contendo as chaves "username",
+        "password", "server" e "mail_box", equivalentes aos
+        parâmetros da função connect_to_exchange().
+        [type: list]
+
+    :param messages:
+        Iterável de dicionários contendo as chaves "mail_to",
+        "subject", "body" e, opcionalmente, "zip_attachments",
+        equivalentes aos parâmetros da função send_mail(). Como
+        as mensagens são enviadas a outros processos, os anexos
+        devem ser fornecidos como lista de tuplas (nome, arquivo)
+        e não como um objeto zip.
+        [type: iterable]
+
+    :param rate_limit:
+        Quantidade máxima de envios por segundo de cada caixa.
+        [type: float, default=None]
+
+    :param queue_size:
+        Tamanho máximo da fila de mensagens aguardando envio.
+        [type: int, default=1000]
+
+    :param progress_callback:
+        Função opcional chamada a cada mensagem processada com
+        o resumo parcial dos envios como único argumento.
+        [type: callable, default=None]
+
+    :param send_func:
+        Função opcional de envio utilizada no lugar da conta
+        exchangelib, chamada nos processos com os parâmetros da
+        credencial e da mensagem (ex: send_mail). Deve ser
+        definida no nível de um módulo para ser enviada aos
+        processos.
+        [type: callable, default=None]
+
+    Retorno
+    -------
+    :return summary:
+        Dicionário com o resumo dos envios contendo as chaves
+        "sent", "failed", "errors" (lista de tuplas com índice
+        da mensagem, caixa e erro), "per_mailbox", "elapsed"
+        (em segundos) e "throughput" (mensagens por segundo).
+        [type: dict]
+    """
+
+    start = time.monotonic()
+    summary = {
+        'sent': 0,
+        'failed': 0,
+        'errors': [],
+        'per_mailbox': {c['mail_box']: {'sent': 0, 'failed': 0} for c in credentials},
+        'elapsed': 0.0,
+        'throughput': 0.0
+    }
+
+    # Consolidando resultados enviados pelos processos
+    def collect(block):
+        try:
+            status, mail_box, idx, error = out_queue.get(block, timeout=0.1)
+        except Empty:
+            return False
+        if status in ('done', 'fatal'):
+            if error is not None:
+                summary['errors'].append((None, mail_box, error))
+            return True
+        summary[status] += 1
+        summary['per_mailbox'][mail_box][status] += 1
+        if error is not None:
+            summary['errors'].append((idx, mail_box, error))
+        summary['elapsed'] = time.monotonic() - start
+        summary['throughput'] = summary['sent'] / summary['elapsed'] if summary['elapsed'] else 0.0
+        if progress_callback is not None:
+            progress_callback(summary)
+        return True
+
+    # Iniciando um processo por caixa de e-mail. O método "spawn" evita que
+    # os processos herdem conexões já abertas pela exchangelib no processo pai
+    ctx = multiprocessing.get_context('spawn')
+    in_queue = ctx.Queue(maxsize=queue_size)
+    out_queue = ctx.Queue()
+    workers = [
+        ctx.Process(
+            target=_shard_worker,
+            args=(creds, in_queue, out_queue, rate_limit, send_func),
+            daemon=True
+        ) for creds in credentials
+    ]
+    for worker in workers:
+        worker.start()
+
+    # Processos encerrados abruptamente (ex: falta de memória) contam como finalizados
+    def running():
+        return any(w.is_alive() for w in workers)
+
+    # Inserindo itens na fila enquanto houver processos ativos
+    def feed(item):
+        while running():
+            try:
+                in_queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                while collect(block=False):
+                    pass
+        return False
+
+    # Alimentando a fila compartilhada e consolidando o progresso
+    messages = iter(messages)
+    total = 0
+    for idx, message in enumerate(messages):
+        total += 1
+        if not feed((idx, message)):
+            break
+        while collect(block=False):
+            pass
+
+    # Sinalizando fim das mensagens e aguardando os processos
+    for _ in workers:
+        if not feed(None):
+            break
+    while running():
+        collect(block=True)
+    for worker in workers:
+        worker.join()
+    while collect(block=True):
+        pass
+
+    # Itens restantes na fila não serão consumidos: descartando-os para que a
+    # thread de escrita da fila não bloqueie o encerramento do interpretador
+    in_queue.cancel_join_thread()
+    in_queue.close()
+
+    # Registrando processos encerrados de forma inesperada
+    for creds, worker in zip(credentials, workers):
+        if worker.exitcode != 0:
+            summary['errors'].append((None, creds['mail_box'], f'Processo encerrado inesperadamente (exitcode={worker.exitcode})'))
+
+    # Mensagens não processadas por falta de caixas disponíveis
+    for _ in messages:
+        total += 1
+    unprocessed = total - summary['sent'] - summary['failed']
+    if unprocessed:
+        summary['failed'] += unprocessed
+        summary['errors'].append((None, None, f'{unprocessed} mensagens não enviadas: nenhuma caixa de e-mail disponível'))
+
+    summary['elapsed'] = time.monotonic() - start
+    summary['throughput'] = summary['sent'] / summary['elapsed'] if summary['elapsed'] else 0.0
+
+    return summary
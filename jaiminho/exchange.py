@@ -40,11 +40,15 @@ from exchangelib import Credentials, Account, Configuration, Message, \
 
 # Bibliotecas gerais
 from pandas import DataFrame
-from io import BytesIO
+from io import BytesIO, TextIOWrapper
+import gzip
 
 # Formatação html customizada
 from pretty_html_table import build_table
 
+# Log de envios para idempotência
+from jaiminho.sendlog import message_key, open_send_log, was_sent, record_send
+
 
 """
 ---------------------------------------------------
@@ -84,7 +88,10 @@ def connect_to_exchange(username, password, server, mail_box):
         Servidor de gerenciamento de e-mails utilizado nas
         operações a serem realizadas pelo objeto de conta
         criado. Um exemplo prático do servidor associado ao
-        outlook do office 365 é: "outlook.office365.com"
+        outlook do office 365 é: "outlook.office365.com". Também
+        é possível fornecer a URL completa do endpoint EWS (ex:
+        "http://127.0.0.1:8080/EWS/Exchange.asmx"), utilizada
+        diretamente como "service_endpoint" da configuração.
         [type: string]
 
     :param mail_box:
@@ -112,10 +119,17 @@ def connect_to_exchange(username, password, server, mail_box):
     )
 
     # Configurando servidor com as credenciais fornecidas
-    config = Configuration(
-        server=server, 
-        credentials=creds
-    )
+    if server.startswith(('http://', 'https://')):
+        # Endpoint EWS completo (ex: servidores locais de teste)
+        config = Configuration(
+            service_endpoint=server,
+            credentials=creds
+        )
+    else:
+        config = Configuration(
+            server=server, 
+            credentials=creds
+        )
 
     # Criando objeto de conta com todo o ambiente já configurado
     account = Account(
@@ -177,6 +191,54 @@ def create_message(account, subject, body, to_recipients):
 
     return m
 
+# Lendo conteúdo de anexos em bytes
+def get_attachment_content(file):
+    """
+    Transforma os diferentes tipos primitivos aceitos como
+    anexo em um conteúdo único em bytes. Na prática, esta
+    função consolida as regras de leitura utilizadas pela
+    função attach_file(), permitindo que outros módulos do
+    pacote (como o envio assíncrono) reaproveitem a mesma
+    lógica sem depender de um objeto Message.
+
+    Parâmetros
+    ----------
+    :param file:
+        Arquivo a ser lido. Este parâmetro pode conter:
+            * Referência de caminho do arquivo local no SO
+            * Conteúdo em bytes já lido previamente
+            * Objeto DataFrame do pandas a ser lido como csv
+        [type: str, bytes ou DataFrame]
+
+    Retorno
+    -------
+    :return content:
+        Conteúdo do arquivo em bytes ou None caso o tipo
+        primitivo do parâmetro "file" não seja suportado.
+        [type: bytes]
+    """
+
+    # Leitura de arquivo local em bytes
+    if type(file) is str:
+        with open(file, 'rb') as f:
+            content = f.read()
+
+    # Salva objeto DataFrame em buffer para posterior leitura
+    elif type(file) is DataFrame:
+        buffer = BytesIO()
+        file.to_csv(buffer)
+        content = buffer.getvalue()
+
+    # Arquivo passado já encontra-se em bytes
+    elif type(file) is bytes:
+        content = file
+
+    # Formato do anexo inválido
+    else:
+        content = None
+
+    return content
+
 # Anexando arquivos à mensagem
 def attach_file(message, file, attachment_name, is_inline=False):
     """
@@ -222,23 +284,11 @@ def attach_file(message, file, attachment_name, is_inline=False):
     :param is_inline:
     """
 
-    # Leitura de arquivo local em bytes
-    if type(file) is str:
-        with open(file, 'rb') as f:
-            content = f.read()
-
-    # Salva objeto DataFrame em buffer para posterior leitura
-    elif type(file) is DataFrame:
-        buffer = BytesIO()
-        file.to_csv(buffer)
-        content = buffer.getvalue()
+    # Lendo conteúdo do anexo em bytes
+    content = get_attachment_content(file)
 
-    # Arquivo passado já encontra-se em bytes
-    elif type(file) is bytes:
-        content = file
-    
     # Formato do anexo inválido
-    else:
+    if content is None:
         print(f'Formato do parâmetro "file" ({type(file)}) inválido. Retornando mensagem sem anexo')
         return message
 
@@ -312,9 +362,142 @@ def df_to_html(df, color='blue_light', font_size='medium',
 
     return df_html
 
+# Construindo corpo de e-mail com DataFrames grandes
+def build_df_body(df, max_bytes=1000000, max_rows=None, summary=False,
+                  attachment_name='dados.csv.gz', chunk_rows=100,
+                  color='blue_light', font_size='medium',
+                  font_family='Century Gothic', text_align='left'):
+    """
+    Constrói um corpo HTML para um objeto DataFrame respeitando
+    um limite de tamanho em bytes. As linhas da tabela são geradas
+    em partes de "chunk_rows" registros e incluídas no corpo
+    apenas enquanto couberem no limite "max_bytes" (e em "max_rows",
+    se informado). Caso o DataFrame não caiba por completo, ou caso
+    seja solicitado um resumo estatístico via "summary", os dados
+    completos são automaticamente compactados em um arquivo csv.gz
+    e retornados como anexo. Assim, o tamanho da mensagem e o uso
+    de memória permanecem limitados independente do tamanho do
+    DataFrame fornecido. DataFrames sem linhas resultam em uma
+    tabela vazia e DataFrames sem colunas em um aviso textual.
+    Caso nem o cabeçalho da tabela (ou o resumo estatístico) caiba
+    no limite, como em DataFrames muito largos, o corpo contém
+    apenas um aviso e os dados seguem integralmente em anexo.
+
+    Parâmetros
+    ----------
+    :param df:
+        Objeto DataFrame do pandas a ser enviado por e-mail.
+        [type: pd.DataFrame]
+
+    :param max_bytes:
+        Tamanho máximo (em bytes) do HTML gerado para o corpo.
+        [type: int, default=1000000]
+
+    :param max_rows:
+        Quantidade máxima de linhas exibidas no corpo.
+        [type: int, default=None]
+
+    :param summary:
+        Flag para exibição de um resumo estatístico do DataFrame
+        (método describe() do pandas) no lugar de suas linhas.
+        [type: bool, default=False]
+
+    :param attachment_name:
+        Nome do anexo compactado com os dados completos.
+        [type: string, default='dados.csv.gz']
+
+    :param chunk_rows:
+        Quantidade de linhas formatadas a cada parte gerada.
+        Valores pares preservam a alternância de cores das
+        linhas da tabela entre as partes.
+        [type: int, default=100]
+
+    Os demais parâmetros são repassados à função df_to_html().
+
+    Retorno
+    -------
+    :return body, attachments:
+        Corpo HTML a ser utilizado na mensagem e lista contendo
+        o anexo compactado no formato (nome, conteúdo em bytes),
+        vazia caso o DataFrame caiba integralmente no corpo. A
+        lista pode ser fornecida diretamente ao parâmetro
+        "zip_attachments" da função send_mail().
+        [type: tuple]
+    """
+
+    style = dict(color=color, font_size=font_size, font_family=font_family,
+                 text_align=text_align)
+    total_rows = len(df)
+    max_rows = total_rows if max_rows is None else min(max_rows, total_rows)
+
+    # DataFrame sem colunas não possui conteúdo a ser exibido ou resumido
+    if len(df.columns) == 0:
+        return f'<p>DataFrame sem colunas ({total_rows} linhas).</p>', []
+
+    # Espaço reservado para o aviso sobre os dados completos em anexo
+    reserved = 512
+
+    # Resumo estatístico no lugar das linhas
+    if summary:
+        body = df_to_html(df.describe().reset_index(), **style)
+        shown_rows = 0
+        # Resumo de DataFrames muito largos substituído apenas pelo aviso
+        if reserved + len(body.encode('utf-8')) > max_bytes:
+            body = ''
+
+    # Incluindo linhas em partes enquanto couberem no limite estabelecido
+    else:
+        # Abertura e fechamento da tabela obtidos a partir de uma linha vazia,
+        # de modo que DataFrames sem linhas resultem em uma tabela vazia
+        template = DataFrame(columns=df.columns, index=[0])
+        opening, rows = df_to_html(template, **style).split('<tbody>', 1)
+        body = opening + '<tbody>'
+        closing = '</tbody>' + rows.rsplit('</tbody>', 1)[1]
+        shown_rows = 0
+
+        # Reservando espaço para o fechamento da tabela e o aviso de anexo
+        size = reserved + len(body.encode('utf-8')) + len(closing.encode('utf-8'))
+
+        # Cabeçalho de DataFrames muito largos não cabe no limite estabelecido
+        if size > max_bytes:
+            body = ''
+        else:
+            for i in range(0, max_rows, chunk_rows):
+                chunk = df.iloc[i:min(i + chunk_rows, max_rows)]
+                rows = df_to_html(chunk, **style).split('<tbody>', 1)[1].rsplit('</tbody>', 1)[0]
+                size += len(rows.encode('utf-8'))
+                if size > max_bytes:
+                    break
+                body += rows
+                shown_rows += len(chunk)
+            body += closing
+
+            # DataFrame coube integralmente no corpo
+            if shown_rows == total_rows:
+                return body, []
+
+    # Compactando dados completos em partes para o anexo
+    buffer = BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb') as gz:
+        with TextIOWrapper(gz, encoding='utf-8', newline='') as wrapper:
+            for i in range(0, total_rows, 10000):
+                df.iloc[i:i + 10000].to_csv(wrapper, header=(i == 0))
+
+    # Aviso sobre os dados completos em anexo
+    if not body:
+        note = f'<p>Tabela com {len(df.columns)} colunas e {total_rows} linhas excede o limite do corpo.'
+    elif summary:
+        note = f'<p>Resumo estatístico de {total_rows} linhas.'
+    else:
+        note = f'<p>Exibindo as primeiras {shown_rows} de {total_rows} linhas.'
+    body += f'{note} Os dados completos seguem em anexo ({attachment_name}).</p>'
+
+    return body, [(attachment_name, buffer.getvalue())]
+
 # Enviando mensagens
 def send_mail(username, password, server, mail_box, mail_to, subject, 
-              body, zip_attachments=None, send=True):
+              body, zip_attachments=None, send=True, send_log=None,
+              dedup_window=86400):
     """
     Função encapsulada para o envio de e-mails utilizando uma única
     linha de código. Na prática, esta função se utiliza de funções
@@ -402,8 +585,39 @@ def send_mail(username, password, server, mail_box, mail_to, subject,
         para o envio do e-mail. Caso este flag seja configurado como
         False, haverá o retorno da mensagem preparada ao usuário.
         [type: bool, default=True]
+
+    :param send_log:
+        Caminho opcional de um arquivo SQLite utilizado como log
+        de envios (ver módulo sendlog). Quando fornecido, uma chave
+        calculada a partir da caixa remetente, do título, dos
+        destinatários, do corpo e dos anexos da mensagem é
+        consultada antes do envio: caso uma mensagem
+        idêntica tenha sido enviada dentro da janela "dedup_window",
+        o envio é ignorado sem sequer conectar ao servidor. Útil
+        para evitar e-mails duplicados em reexecuções de rotinas.
+        [type: string, default=None]
+
+    :param dedup_window:
+        Janela de tempo (em segundos) em que envios idênticos são
+        ignorados quando o parâmetro "send_log" é fornecido.
+        [type: float, default=86400]
     """
 
+    # Verificando envios anteriores no log de idempotência
+    if send and send_log is not None:
+        # Anexos lidos uma única vez para cálculo da chave e envio
+        if zip_attachments is not None:
+            zip_attachments = [(name, get_attachment_content(file)) for name, file in zip_attachments]
+        key = message_key(mail_box, mail_to, subject, body, zip_attachments)
+        log = open_send_log(send_log)
+        try:
+            sent = was_sent(log, key, window=dedup_window)
+        finally:
+            log.close()
+        if sent:
+            print(f'Mensagem idêntica já enviada nos últimos {dedup_window} segundos. Envio ignorado')
+            return
+
     # Instanciando elemento de conta utilizando credenciais fornecidas
     acc = connect_to_exchange(
         username=username,
@@ -432,6 +646,14 @@ def send_mail(username, password, server, mail_box, mail_to, subject,
     # Enviando mensagem se aplicável
     if send:
         m.send_and_save()
+
+        # Registrando envio no log de idempotência
+        if send_log is not None:
+            log = open_send_log(send_log)
+            try:
+                record_send(log, key)
+            finally:
+                log.close()
     else:
         return m
 
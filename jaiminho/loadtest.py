@@ -0,0 +1,538 @@
+"""
+---------------------------------------------------
+---------------- MÓDULO: loadtest -----------------
+---------------------------------------------------
+Dentro da proposta do pacote jaiminho, este módulo
+oferece um gerador de carga para o dimensionamento
+de rotinas de envio de e-mails. As funções de envio
+do pacote (ou quaisquer outras) são executadas a uma
+taxa e concorrência configuráveis, sendo reportados
+a vazão obtida, as latências (p50, p90 e p99), os
+erros por tipo e o consumo de memória. Em conjunto
+com o servidor EWS local do módulo mock_server, que
+permite a injeção de latência, throttling e erros,
+os testes podem ser executados de forma totalmente
+offline, inclusive em pipelines de CI:
+
+    python -m jaiminho.loadtest --target send_mail_async \
+        --messages 5000 --rate 1000 --concurrency 500 \
+        --latency 0.05 --throttle-rate 2000
+
+APIs de envio em lote (send_many_async e send_sharded)
+também podem ser avaliadas; nesse caso, a vazão total é
+reportada, porém a latência individual das mensagens
+não é medida, já que essas funções não a expõem.
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+2. Gerador de carga
+    2.1 Funções auxiliares
+    2.2 Execução de testes de carga
+    2.3 Execução de testes de carga em lote
+3. Execução via linha de comando
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades do próprio pacote
+from jaiminho.mock_server import start_mock_ews_server
+
+# Bibliotecas gerais
+import argparse
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import BoundedSemaphore, Lock
+import math
+import time
+import tracemalloc
+
+# Consumo máximo de memória do processo (indisponível no Windows)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+"""
+---------------------------------------------------
+--------------- 2. GERADOR DE CARGA ---------------
+               2.1 Funções auxiliares
+---------------------------------------------------
+"""
+
+# Mensagem padrão utilizada nos testes de carga
+def _default_message(i):
+    return {
+        'mail_to': ['destinatario@jaiminho.test'],
+        'subject': f'[Jaiminho] loadtest - Mensagem {i}',
+        'body': f'<p>Mensagem {i} gerada pelo teste de carga do jaiminho</p>'
+    }
+
+# Calculando percentil (nearest-rank) de uma lista ordenada
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    idx = max(0, min(len(values) - 1, math.ceil(q / 100 * len(values)) - 1))
+    return values[idx]
+
+# Executando corrotina em um novo event loop (equivalente a asyncio.run() no Python 3.6)
+def _run_coroutine(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+# Consolidando resultados em um relatório
+def _build_report(n_messages, latencies, errors, elapsed, peak_memory, sent=None):
+    latencies = sorted(latencies)
+    # Envios em lote não possuem latência individual
+    batch = sent is not None
+    sent = len(latencies) if sent is None else sent
+    max_rss = None
+    if resource is not None:
+        # ru_maxrss é reportado em KB no Linux
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    return {
+        'messages': n_messages,
+        'sent': sent,
+        'failed': sum(errors.values()),
+        'errors': dict(errors),
+        'elapsed': elapsed,
+        'throughput': sent / elapsed if elapsed else 0.0,
+        'latency_ms': None if batch else {
+            'p50': _percentile(latencies, 50) * 1000,
+            'p90': _percentile(latencies, 90) * 1000,
+            'p99': _percentile(latencies, 99) * 1000,
+            'max': latencies[-1] * 1000 if latencies else 0.0,
+            'mean': sum(latencies) / sent * 1000 if sent else 0.0
+        },
+        'peak_memory_mb': peak_memory / 1024 ** 2 if peak_memory is not None else None,
+        'max_rss_mb': max_rss
+    }
+
+# Formatando relatório para exibição
+def format_report(report):
+    """
+    Formata o relatório retornado pelas funções de teste de
+    carga deste módulo como texto para exibição.
+
+    Parâmetros
+    ----------
+    :param report:
+        Relatório retornado por run_load_test(),
+        run_load_test_async() ou run_batch_load_test().
+        [type: dict]
+
+    Retorno
+    -------
+    :return text:
+        Relatório formatado.
+        [type: string]
+    """
+
+    latency = report['latency_ms']
+    lines = [
+        f'Mensagens:       {report["messages"]}',
+        f'Enviadas:        {report["sent"]}',
+        f'Falhas:          {report["failed"]}',
+        f'Tempo total:     {report["elapsed"]:.2f} s',
+        f'Vazão:           {report["throughput"]:.1f} mensagens/s'
+    ]
+    if latency is None:
+        lines.append('Latência (ms):   indisponível para envios em lote')
+    else:
+        lines.append(f'Latência (ms):   p50={latency["p50"]:.1f} p90={latency["p90"]:.1f} '
+                     f'p99={latency["p99"]:.1f} max={latency["max"]:.1f} média={latency["mean"]:.1f}')
+    if report['peak_memory_mb'] is not None:
+        lines.append(f'Pico de memória: {report["peak_memory_mb"]:.1f} MB (alocações Python)')
+    if report['max_rss_mb'] is not None:
+        lines.append(f'RSS máximo:      {report["max_rss_mb"]:.1f} MB')
+    for name, count in sorted(report['errors'].items(), key=lambda item: -item[1]):
+        lines.append(f'Erro {name}: {count}')
+
+    return '\n'.join(lines)
+
+
+"""
+---------------------------------------------------
+--------------- 2. GERADOR DE CARGA ---------------
+         2.2 Execução de testes de carga
+---------------------------------------------------
+"""
+
+# Executando teste de carga com funções síncronas
+def run_load_test(send_func, n_messages=1000, rate=None, concurrency=10,
+                  message_factory=None, trace_memory=False):
+    """
+    Executa um teste de carga sobre uma função de envio síncrona
+    (ex: send_mail com os parâmetros de conexão já fixados via
+    functools.partial). As chamadas são distribuídas entre até
+    "concurrency" threads e iniciadas a uma taxa máxima de "rate"
+    mensagens por segundo, sendo medida a latência de cada envio.
+
+    Parâmetros
+    ----------
+    :param send_func:
+        Função de envio chamada com os parâmetros de cada
+        mensagem ("mail_to", "subject" e "body").
+        [type: callable]
+
+    :param n_messages:
+        Quantidade de mensagens enviadas no teste.
+        [type: int, default=1000]
+
+    :param rate:
+        Taxa máxima (mensagens por segundo) de início de novos
+        envios. Caso seja None, os envios são iniciados assim
+        que houver capacidade disponível.
+        [type: float, default=None]
+
+    :param concurrency:
+        Quantidade máxima de envios simultâneos.
+        [type: int, default=10]
+
+    :param message_factory:
+        Função opcional que recebe o índice da mensagem e
+        retorna o dicionário de parâmetros a ser enviado.
+        [type: callable, default=None]
+
+    :param trace_memory:
+        Flag para medição do pico de memória alocada pelo
+        Python durante o teste (via tracemalloc). A medição
+        adiciona overhead e pode reduzir a vazão observada.
+        [type: bool, default=False]
+
+    Retorno
+    -------
+    :return report:
+        Dicionário contendo as chaves "messages", "sent",
+        "failed", "errors" (contagem por tipo de exceção),
+        "elapsed", "throughput", "latency_ms" (p50, p90, p99,
+        max e mean), "peak_memory_mb" e "max_rss_mb".
+        [type: dict]
+    """
+
+    message_factory = message_factory or _default_message
+    latencies = []
+    errors = Counter()
+    lock = Lock()
+    slots = BoundedSemaphore(concurrency)
+
+    # Envio individual com medição de latência
+    def task(message):
+        try:
+            started = time.perf_counter()
+            send_func(**message)
+            latency = time.perf_counter() - started
+            with lock:
+                latencies.append(latency)
+        except Exception as e:
+            with lock:
+                errors[type(e).__name__] += 1
+        finally:
+            slots.release()
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for i in range(n_messages):
+            # Respeitando taxa de início dos envios
+            if rate:
+                wait = start + i / rate - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+            slots.acquire()
+            executor.submit(task, message_factory(i))
+    elapsed = time.perf_counter() - start
+    peak_memory = None
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return _build_report(n_messages, latencies, errors, elapsed, peak_memory)
+
+# Executando teste de carga com funções assíncronas
+async def run_load_test_async(send_func, n_messages=1000, rate=None,
+                              concurrency=100, message_factory=None,
+                              trace_memory=False):
+    """
+    Versão assíncrona da função run_load_test(), destinada a
+    funções de envio assíncronas (ex: send_mail_async com uma
+    sessão compartilhada fixada via functools.partial). Os
+    envios são executados como tarefas do event loop, com até
+    "concurrency" envios simultâneos. Os parâmetros e o retorno
+    são os mesmos da função run_load_test().
+    """
+
+    message_factory = message_factory or _default_message
+    latencies = []
+    errors = Counter()
+    slots = asyncio.Semaphore(concurrency)
+
+    # Envio individual com medição de latência
+    async def task(message):
+        try:
+            started = time.perf_counter()
+            await send_func(**message)
+            latencies.append(time.perf_counter() - started)
+        except Exception as e:
+            errors[type(e).__name__] += 1
+        finally:
+            slots.release()
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    tasks = set()
+    for i in range(n_messages):
+        # Respeitando taxa de início dos envios
+        if rate:
+            wait = start + i / rate - time.perf_counter()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        await slots.acquire()
+        t = asyncio.ensure_future(task(message_factory(i)))
+        tasks.add(t)
+        t.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.wait(tasks)
+    elapsed = time.perf_counter() - start
+    peak_memory = None
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return _build_report(n_messages, latencies, errors, elapsed, peak_memory)
+
+
+"""
+---------------------------------------------------
+--------------- 2. GERADOR DE CARGA ---------------
+     2.3 Execução de testes de carga em lote
+---------------------------------------------------
+"""
+
+# Nome do erro a partir de uma exceção ou de sua representação em texto
+def _error_name(error):
+    if isinstance(error, BaseException):
+        return type(error).__name__
+    return str(error).split('(', 1)[0]
+
+# Executando teste de carga com funções de envio em lote
+def run_batch_load_test(batch_func, n_messages=1000, message_factory=None,
+                        trace_memory=False):
+    """
+    Executa um teste de carga sobre uma função de envio em lote,
+    que recebe todo o fluxo de mensagens de uma única vez (ex:
+    send_many_async ou send_sharded, adaptadas pelas funções
+    batch_send_many_async() e batch_send_sharded() deste módulo).
+    As mensagens são fornecidas por um gerador e a vazão total é
+    medida do início ao fim do lote. Como essas funções controlam
+    internamente a concorrência e não expõem o tempo de cada envio,
+    a chave "latency_ms" do relatório é retornada como None.
+
+    Parâmetros
+    ----------
+    :param batch_func:
+        Função chamada com o iterável de mensagens (parâmetro
+        "messages"), retornando
+        uma lista com None para cada envio bem sucedido ou com a
+        exceção (ou sua representação em texto) das falhas.
+        [type: callable]
+
+    :param n_messages:
+        Quantidade de mensagens enviadas no teste.
+        [type: int, default=1000]
+
+    :param message_factory:
+        Função opcional que recebe o índice da mensagem e
+        retorna o dicionário de parâmetros a ser enviado.
+        [type: callable, default=None]
+
+    :param trace_memory:
+        Flag para medição do pico de memória alocada pelo
+        Python no processo atual durante o teste.
+        [type: bool, default=False]
+
+    Retorno
+    -------
+    :return report:
+        Dicionário no mesmo formato de run_load_test(), com a
+        chave "latency_ms" igual a None.
+        [type: dict]
+    """
+
+    message_factory = message_factory or _default_message
+    messages = (message_factory(i) for i in range(n_messages))
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    results = batch_func(messages=messages)
+    elapsed = time.perf_counter() - start
+    peak_memory = None
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    errors = Counter(_error_name(r) for r in results if r is not None)
+    sent = sum(1 for r in results if r is None)
+
+    return _build_report(n_messages, [], errors, elapsed, peak_memory, sent=sent)
+
+# Adaptando send_many_async() para testes de carga em lote
+def batch_send_many_async(username, password, server, mail_box, messages,
+                          max_concurrency=1000, max_connections=100):
+    """
+    Executa a função send_many_async() do módulo async_exchange
+    em um novo event loop, retornando a lista de resultados de
+    cada mensagem no formato esperado por run_batch_load_test().
+    Os parâmetros são os mesmos de send_many_async().
+    """
+
+    from jaiminho.async_exchange import send_many_async
+
+    return _run_coroutine(send_many_async(
+        username=username,
+        password=password,
+        server=server,
+        mail_box=mail_box,
+        messages=messages,
+        max_concurrency=max_concurrency,
+        max_connections=max_connections
+    ))
+
+# Adaptando send_sharded() para testes de carga em lote
+def batch_send_sharded(credentials, messages, **kwargs):
+    """
+    Executa a função send_sharded() do módulo dispatcher,
+    convertendo o resumo retornado em uma lista de resultados
+    no formato esperado por run_batch_load_test(). Falhas sem
+    mensagem associada (ex: processos encerrados abruptamente)
+    são reportadas como "MensagemNaoProcessada". Os parâmetros
+    adicionais são repassados à função send_sharded().
+    """
+
+    from jaiminho.dispatcher import send_sharded
+
+    summary = send_sharded(credentials=credentials, messages=messages, **kwargs)
+    errors = [error for idx, _, error in summary['errors'] if idx is not None]
+    unprocessed = summary['failed'] - len(errors)
+
+    return [None] * summary['sent'] + errors + ['MensagemNaoProcessada'] * unprocessed
+
+
+"""
+---------------------------------------------------
+--------- 3. EXECUÇÃO VIA LINHA DE COMANDO --------
+---------------------------------------------------
+"""
+
+# Executando teste de carga contra o servidor EWS local
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m jaiminho.loadtest',
+        description='Teste de carga offline das funções de envio do jaiminho '
+                    'contra um servidor EWS local'
+    )
+    parser.add_argument('--target', choices=['send_mail', 'send_mail_async', 'send_many_async', 'send_sharded'],
+                        default='send_mail_async', help='Função de envio avaliada')
+    parser.add_argument('--messages', type=int, default=1000, help='Quantidade de mensagens')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='Taxa máxima de início de envios (mensagens/s); em send_sharded, dividida entre as caixas')
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help='Envios simultâneos (padrão: 10 para send_mail e 100 para as funções assíncronas)')
+    parser.add_argument('--mailboxes', type=int, default=2, help='Caixas de e-mail (processos) utilizadas em send_sharded')
+    parser.add_argument('--latency', type=float, default=0, help='Latência do servidor (s)')
+    parser.add_argument('--jitter', type=float, default=0, help='Latência adicional aleatória do servidor (s)')
+    parser.add_argument('--throttle-rate', type=float, default=None, help='Limite de requisições/s do servidor')
+    parser.add_argument('--error-rate', type=float, default=0, help='Proporção de erros do servidor')
+    parser.add_argument('--seed', type=int, default=None, help='Semente dos sorteios do servidor')
+    parser.add_argument('--trace-memory', action='store_true', help='Mede o pico de memória via tracemalloc')
+    args = parser.parse_args(args)
+
+    server = start_mock_ews_server(
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    credentials = {
+        'username': 'jaiminho',
+        'password': 'tangamandapio',
+        'server': server.url,
+        'mail_box': 'jaiminho@jaiminho.test'
+    }
+    options = dict(n_messages=args.messages, rate=args.rate, trace_memory=args.trace_memory)
+    batch_options = dict(n_messages=args.messages, trace_memory=args.trace_memory)
+
+    try:
+        if args.target == 'send_many_async':
+            if args.rate:
+                print('Aviso: send_many_async não possui limite de taxa; parâmetro --rate ignorado')
+            concurrency = args.concurrency or 100
+            report = run_batch_load_test(partial(
+                batch_send_many_async,
+                max_concurrency=concurrency,
+                max_connections=concurrency,
+                **credentials
+            ), **batch_options)
+        elif args.target == 'send_sharded':
+            # Uma caixa (e um processo) por credencial, compartilhando o limite de taxa
+            mailboxes = [dict(credentials, mail_box=f'jaiminho{i}@jaiminho.test') for i in range(args.mailboxes)]
+            rate_limit = args.rate / args.mailboxes if args.rate else None
+            report = run_batch_load_test(partial(
+                batch_send_sharded, mailboxes, rate_limit=rate_limit
+            ), **batch_options)
+        elif args.target == 'send_mail':
+            from jaiminho.exchange import send_mail
+            report = run_load_test(partial(send_mail, **credentials),
+                                   concurrency=args.concurrency or 10, **options)
+        else:
+            from jaiminho.async_exchange import create_session, send_mail_async
+
+            # Sessão compartilhada entre todos os envios
+            async def run():
+                session = create_session(
+                    username=credentials['username'],
+                    password=credentials['password'],
+                    max_connections=args.concurrency or 100
+                )
+                try:
+                    return await run_load_test_async(
+                        partial(send_mail_async, session=session, **credentials),
+                        concurrency=args.concurrency or 100, **options
+                    )
+                finally:
+                    await session.close()
+            report = _run_coroutine(run())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(format_report(report))
+    print(f'Servidor:        {server.requests} requisições, {server.throttled} limitadas, {server.errors} com erro')
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,337 @@
+"""
+---------------------------------------------------
+-------------- MÓDULO: mock_server ----------------
+---------------------------------------------------
+Servidor EWS local e simplificado para testes do
+pacote jaiminho sem a necessidade de um servidor
+Exchange real. O servidor responde às operações
+utilizadas no envio de e-mails (tanto pela biblioteca
+exchangelib quanto pelo módulo async_exchange),
+mantendo conexões HTTP/1.1 (keep-alive) e registrando
+as requisições recebidas para posterior validação.
+Adicionalmente, é possível injetar latência, limites
+de envio (throttling) e erros aleatórios, permitindo
+a simulação do comportamento de um servidor Exchange
+em testes de carga totalmente offline.
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+2. Servidor EWS local
+    2.1 Tratamento de requisições
+    2.2 Inicialização do servidor
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas gerais
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from threading import Thread, Lock
+import random
+import re
+import time
+from uuid import uuid4
+
+
+"""
+---------------------------------------------------
+------------- 2. SERVIDOR EWS LOCAL ---------------
+          2.1 Tratamento de requisições
+---------------------------------------------------
+"""
+
+# Namespaces utilizados nas respostas EWS
+NS_SOAP = 'http://schemas.xmlsoap.org/soap/envelope/'
+NS_MESSAGES = 'http://schemas.microsoft.com/exchange/services/2006/messages'
+NS_TYPES = 'http://schemas.microsoft.com/exchange/services/2006/types'
+NS_ERRORS = 'http://schemas.microsoft.com/exchange/services/2006/errors'
+
+# Operação EWS solicitada no corpo da requisição
+OPERATION_PATTERN = re.compile(rb'<(?:\w+:)?Body[^>]*>\s*<(?:\w+:)?(\w+)')
+
+
+# Construindo envelope de resposta de uma operação EWS
+def _ews_response(operation, response_class='Success', code='NoError', content=''):
+    text = '' if code == 'NoError' else f'<m:MessageText>{code} (mock)</m:MessageText>'
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<s:Envelope xmlns:s="{NS_SOAP}">'
+        '<s:Header>'
+        '<h:ServerVersionInfo MajorVersion="15" MinorVersion="1" MajorBuildNumber="2375" '
+        f'MinorBuildNumber="7" Version="V2017_07_11" xmlns:h="{NS_TYPES}"/>'
+        '</s:Header>'
+        '<s:Body>'
+        f'<m:{operation}Response xmlns:m="{NS_MESSAGES}" xmlns:t="{NS_TYPES}">'
+        '<m:ResponseMessages>'
+        f'<m:{operation}ResponseMessage ResponseClass="{response_class}">'
+        f'{text}<m:ResponseCode>{code}</m:ResponseCode>{content}'
+        f'</m:{operation}ResponseMessage>'
+        '</m:ResponseMessages>'
+        f'</m:{operation}Response>'
+        '</s:Body>'
+        '</s:Envelope>'
+    ).encode('utf-8')
+
+# Construindo falha SOAP de throttling, no formato retornado pelo Exchange (HTTP 500)
+def _server_busy_fault(back_off_ms):
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<s:Envelope xmlns:s="{NS_SOAP}">'
+        '<s:Body>'
+        '<s:Fault>'
+        f'<faultcode xmlns:a="{NS_TYPES}">a:ErrorServerBusy</faultcode>'
+        '<faultstring xml:lang="en-US">The server cannot service this request right now. Try again later.</faultstring>'
+        '<detail>'
+        f'<e:ResponseCode xmlns:e="{NS_ERRORS}">ErrorServerBusy</e:ResponseCode>'
+        f'<e:Message xmlns:e="{NS_ERRORS}">The server cannot service this request right now. Try again later.</e:Message>'
+        f'<t:MessageXml xmlns:t="{NS_TYPES}">'
+        f'<t:Value Name="BackOffMilliseconds">{back_off_ms}</t:Value>'
+        '</t:MessageXml>'
+        '</detail>'
+        '</s:Fault>'
+        '</s:Body>'
+        '</s:Envelope>'
+    ).encode('utf-8')
+
+# Resposta de sucesso de acordo com a operação solicitada
+def _success_response(operation, payload):
+    # Identificação do servidor feita pela exchangelib antes dos envios
+    if operation == 'ResolveNames':
+        return _ews_response(operation, 'Error', 'ErrorNameResolutionNoResults')
+
+    # Mensagens salvas como rascunho antes do envio retornam seu identificador
+    if operation == 'CreateItem' and b'MessageDisposition="SaveOnly"' in payload:
+        return _ews_response(operation, content=(
+            '<m:Items><t:Message>'
+            f'<t:ItemId Id="{uuid4().hex}" ChangeKey="{uuid4().hex}"/>'
+            '</t:Message></m:Items>'
+        ))
+    if operation == 'CreateItem':
+        return _ews_response(operation, content='<m:Items/>')
+
+    # Pasta de itens enviados consultada pela exchangelib
+    if operation == 'GetFolder':
+        return _ews_response(operation, content=(
+            '<m:Folders><t:Folder>'
+            f'<t:FolderId Id="{uuid4().hex}" ChangeKey="{uuid4().hex}"/>'
+            '<t:FolderClass>IPF.Note</t:FolderClass>'
+            '<t:DisplayName>Sent Items</t:DisplayName>'
+            '</t:Folder></m:Folders>'
+        ))
+
+    # Anexos incluídos em mensagens salvas
+    if operation == 'CreateAttachment':
+        return _ews_response(operation, content=(
+            '<m:Attachments><t:FileAttachment>'
+            f'<t:AttachmentId Id="{uuid4().hex}" RootItemId="{uuid4().hex}" RootItemChangeKey="{uuid4().hex}"/>'
+            '</t:FileAttachment></m:Attachments>'
+        ))
+
+    return _ews_response(operation)
+
+
+class MockEWSHandler(BaseHTTPRequestHandler):
+    """
+    Trata as requisições POST recebidas pelo servidor local,
+    registrando o payload, aplicando as falhas configuradas
+    e respondendo de acordo com a operação solicitada.
+    """
+
+    # Mantendo conexões abertas entre requisições (keep-alive)
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        payload = self.rfile.read(length)
+        match = OPERATION_PATTERN.search(payload)
+        operation = match.group(1).decode('ascii') if match else 'Unknown'
+        self.server.record(payload)
+
+        # Latência simulada do servidor
+        delay = self.server.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        # Falhas injetadas não se aplicam à identificação do servidor
+        failure = None if operation == 'ResolveNames' else self.server.failure()
+        status = 200
+        if failure is None:
+            response = _success_response(operation, payload)
+        elif failure == 'ErrorServerBusy':
+            status = 500
+            response = _server_busy_fault(self.server.back_off_ms)
+        else:
+            response = _ews_response(operation, 'Error', failure)
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        # Silenciando logs de acesso do servidor
+        pass
+
+
+class MockEWSServer(ThreadingMixIn, HTTPServer):
+    """
+    Servidor HTTP com uma thread por conexão que armazena
+    a quantidade de requisições recebidas, limitadas e com
+    erro e, opcionalmente, os payloads correspondentes.
+    """
+
+    daemon_threads = True
+
+    # Fila de conexões compatível com testes de alta concorrência
+    request_queue_size = 1024
+
+    def __init__(self, address, keep_payloads=False, latency=0, jitter=0,
+                 throttle_rate=None, error_rate=0, seed=None, back_off_ms=1000):
+        super().__init__(address, MockEWSHandler)
+        self.keep_payloads = keep_payloads
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.back_off_ms = back_off_ms
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.payloads = []
+        self._lock = Lock()
+        self._random = random.Random(seed)
+        self._tokens = throttle_rate or 0
+        self._last_refill = time.monotonic()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/EWS/Exchange.asmx'
+
+    def record(self, payload):
+        with self._lock:
+            self.requests += 1
+            if self.keep_payloads:
+                self.payloads.append(payload)
+
+    def delay(self):
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def failure(self):
+        with self._lock:
+            # Limite de requisições por segundo (token bucket)
+            if self.throttle_rate:
+                now = time.monotonic()
+                self._tokens = min(self.throttle_rate,
+                                   self._tokens + (now - self._last_refill) * self.throttle_rate)
+                self._last_refill = now
+                if self._tokens < 1:
+                    self.throttled += 1
+                    return 'ErrorServerBusy'
+                self._tokens -= 1
+
+            # Erros aleatórios do servidor
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.errors += 1
+                return 'ErrorInternalServerError'
+
+        return None
+
+
+"""
+---------------------------------------------------
+------------- 2. SERVIDOR EWS LOCAL ---------------
+          2.2 Inicialização do servidor
+---------------------------------------------------
+"""
+
+# Iniciando servidor local em uma thread separada
+def start_mock_ews_server(host='127.0.0.1', port=0, keep_payloads=False,
+                          latency=0, jitter=0, throttle_rate=None, error_rate=0,
+                          seed=None, back_off_ms=1000):
+    """
+    Inicia o servidor EWS local em uma thread em segundo plano.
+    O endpoint a ser utilizado como parâmetro "server" nas
+    funções de envio fica disponível no atributo "url" do
+    objeto retornado. Ao final dos testes, o servidor deve
+    ser encerrado com os métodos shutdown() e server_close().
+
+    Parâmetros
+    ----------
+    :param host:
+        Endereço de escuta do servidor.
+        [type: string, default='127.0.0.1']
+
+    :param port:
+        Porta de escuta do servidor. O valor 0 seleciona
+        automaticamente uma porta livre.
+        [type: int, default=0]
+
+    :param keep_payloads:
+        Flag para armazenamento dos payloads recebidos.
+        [type: bool, default=False]
+
+    :param latency:
+        Latência fixa (em segundos) adicionada a cada resposta.
+        [type: float, default=0]
+
+    :param jitter:
+        Latência adicional aleatória (em segundos), sorteada
+        uniformemente entre 0 e o valor fornecido.
+        [type: float, default=0]
+
+    :param throttle_rate:
+        Quantidade máxima de requisições por segundo aceitas
+        pelo servidor. Requisições excedentes são respondidas
+        com um soap:Fault "ErrorServerBusy" (HTTP 500), assim
+        como no throttling do Exchange.
+        [type: float, default=None]
+
+    :param error_rate:
+        Proporção de requisições respondidas com o erro
+        "ErrorInternalServerError".
+        [type: float, default=0]
+
+    :param seed:
+        Semente dos sorteios de latência e erros.
+        [type: int, default=None]
+
+    :param back_off_ms:
+        Tempo de espera (em milissegundos) informado no campo
+        "BackOffMilliseconds" das respostas de throttling.
+        [type: int, default=1000]
+
+    Retorno
+    -------
+    :return server:
+        Servidor local em execução.
+        [type: MockEWSServer]
+    """
+
+    server = MockEWSServer(
+        (host, port),
+        keep_payloads=keep_payloads,
+        latency=latency,
+        jitter=jitter,
+        throttle_rate=throttle_rate,
+        error_rate=error_rate,
+        seed=seed,
+        back_off_ms=back_off_ms
+    )
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
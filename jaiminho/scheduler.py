@@ -0,0 +1,354 @@
+"""
+---------------------------------------------------
+---------------- MÓDULO: scheduler ----------------
+---------------------------------------------------
+Dentro da proposta do pacote jaiminho, este módulo
+permite o agendamento de e-mails para envio futuro
+(ex: "enviar às 08:00") e a suavização de rajadas de
+envio. As mensagens agendadas são persistidas em uma
+fila local (SQLite) indexada pelo horário de entrega,
+sobrevivendo a reinicializações do processo, e são
+liberadas para envio a uma taxa máxima configurável
+(token bucket). Dessa forma, relatórios gerados em
+rajadas chegam ao servidor Exchange de forma regular,
+evitando o acionamento de limites de envio.
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+2. Agendamento de e-mails
+    2.1 Funções auxiliares
+    2.2 Agendamento e execução da fila
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades do próprio pacote
+from jaiminho.exchange import get_attachment_content, send_mail
+
+# Bibliotecas gerais
+from base64 import b64decode, b64encode
+from datetime import datetime, timedelta
+import json
+import sqlite3
+import time
+
+
+"""
+---------------------------------------------------
+------------- 2. AGENDAMENTO DE EMAILS ------------
+               2.1 Funções auxiliares
+---------------------------------------------------
+"""
+
+# Abrindo fila de envios local
+def _open_queue(path):
+    conn = sqlite3.connect(path, timeout=30)
+    with conn:
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS pending ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'deliver_at REAL NOT NULL, '
+            'attempts INTEGER NOT NULL DEFAULT 0, '
+            'claimed_until REAL, '
+            'message TEXT NOT NULL)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS pending_deliver_at ON pending (deliver_at, id)')
+
+        # Filas criadas por versões anteriores não possuem a coluna de reserva
+        columns = [column[1] for column in conn.execute('PRAGMA table_info(pending)')]
+        if 'claimed_until' not in columns:
+            conn.execute('ALTER TABLE pending ADD COLUMN claimed_until REAL')
+
+    return conn
+
+# Convertendo horário de entrega em timestamp
+def _to_timestamp(deliver_at):
+    if deliver_at is None:
+        return time.time()
+
+    # String "HH:MM" convertida na próxima ocorrência do horário
+    if type(deliver_at) is str:
+        hour, minute = map(int, deliver_at.split(':'))
+        now = datetime.now()
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return target.timestamp()
+
+    # Objetos datetime sem fuso horário são considerados em horário local
+    if isinstance(deliver_at, datetime):
+        return deliver_at.timestamp()
+
+    return float(deliver_at)
+
+# Serializando mensagem em JSON, com anexos codificados em base64
+def _dump_message(message):
+    attachments = message['zip_attachments']
+    if attachments is not None:
+        attachments = [[name, b64encode(content).decode('ascii')] for name, content in attachments]
+
+    return json.dumps(dict(message, zip_attachments=attachments))
+
+# Lendo mensagem serializada na fila
+def _load_message(data):
+    message = json.loads(data)
+    attachments = message['zip_attachments']
+    if attachments is not None:
+        message['zip_attachments'] = [(name, b64decode(content)) for name, content in attachments]
+
+    return message
+
+
+"""
+---------------------------------------------------
+------------- 2. AGENDAMENTO DE EMAILS ------------
+        2.2 Agendamento e execução da fila
+---------------------------------------------------
+"""
+
+# Agendando mensagem para envio futuro
+def schedule_mail(queue_path, mail_to, subject, body, zip_attachments=None,
+                  deliver_at=None):
+    """
+    Agenda uma mensagem para envio a partir do horário informado,
+    persistindo-a na fila local. Os anexos são lidos em bytes no
+    momento do agendamento, de modo que a mensagem independa de
+    arquivos locais ou objetos em memória no momento do envio.
+    As credenciais não são armazenadas na fila, sendo fornecidas
+    apenas à função run_scheduler().
+
+    Parâmetros
+    ----------
+    :param queue_path:
+        Caminho do arquivo SQLite da fila de envios.
+        [type: string]
+
+    :param mail_to:
+        Lista de destinatários da mensagem.
+        [type: list]
+
+    :param subject:
+        Título da mensagem ser enviada por e-mail.
+        [type: string]
+
+    :param body:
+        Corpo da mensagem a ser enviada por e-mail.
+        [type: string]
+
+    :param zip_attachments:
+        Elemento zipado contendo nomes e arquivos a serem
+        anexados (ver função send_mail() do módulo exchange).
+        [type: zip, default=None]
+
+    :param deliver_at:
+        Horário a partir do qual a mensagem pode ser enviada,
+        fornecido como objeto datetime, timestamp ou string no
+        formato "HH:MM" (próxima ocorrência do horário). Caso
+        seja None, a mensagem é liberada imediatamente.
+        [type: datetime, float ou string, default=None]
+
+    Retorno
+    -------
+    :return message_id:
+        Identificador da mensagem na fila de envios.
+        [type: int]
+    """
+
+    # Anexos lidos em bytes para persistência
+    attachments = None
+    if zip_attachments is not None:
+        attachments = []
+        for name, file in zip_attachments:
+            content = get_attachment_content(file)
+            if content is None:
+                print(f'Formato do parâmetro "file" ({type(file)}) inválido. Ignorando anexo {name}')
+                continue
+            attachments.append((name, content))
+
+    message = {
+        'mail_to': list(mail_to),
+        'subject': subject,
+        'body': body,
+        'zip_attachments': attachments
+    }
+
+    conn = _open_queue(queue_path)
+    try:
+        with conn:
+            cursor = conn.execute(
+                'INSERT INTO pending (deliver_at, message) VALUES (?, ?)',
+                (_to_timestamp(deliver_at), _dump_message(message))
+            )
+    finally:
+        conn.close()
+
+    return cursor.lastrowid
+
+# Executando fila de envios
+def run_scheduler(queue_path, rate=1.0, burst=1, run_until_empty=False,
+                  max_messages=None, poll_interval=5.0, retry_delay=60,
+                  max_attempts=3, send_func=send_mail, **send_kwargs):
+    """
+    Executa a fila de envios, liberando as mensagens cujo horário
+    de entrega já foi atingido em ordem cronológica. A liberação
+    respeita uma taxa máxima de "rate" mensagens por segundo, com
+    rajadas de até "burst" mensagens, suavizando picos de envio.
+    Cada mensagem é removida da fila somente após o envio bem
+    sucedido; em caso de falha, o envio é reagendado após
+    "retry_delay" segundos até o limite de "max_attempts"
+    tentativas. Para evitar duplicidades caso o processo seja
+    interrompido entre o envio e a remoção da fila, recomenda-se
+    fornecer o parâmetro "send_log" da função send_mail(). Antes
+    do envio, cada mensagem é reservada na fila por "retry_delay"
+    segundos, permitindo a execução de múltiplas instâncias sobre
+    um mesmo arquivo sem envios duplicados. Mensagens reservadas
+    são ignoradas pelas demais instâncias e cada reserva conta
+    como uma tentativa de envio; caso o processo seja
+    interrompido, a mensagem é liberada novamente após esse prazo.
+
+    Parâmetros
+    ----------
+    :param queue_path:
+        Caminho do arquivo SQLite da fila de envios.
+        [type: string]
+
+    :param rate:
+        Quantidade máxima de envios por segundo.
+        [type: float, default=1.0]
+
+    :param burst:
+        Quantidade máxima de envios liberados em sequência
+        após um período ocioso.
+        [type: int, default=1]
+
+    :param run_until_empty:
+        Flag para encerramento da execução quando a fila não
+        possuir mais mensagens pendentes, desconsiderando as
+        reservadas por outras instâncias. Caso seja False, a
+        fila é verificada continuamente.
+        [type: bool, default=False]
+
+    :param max_messages:
+        Quantidade de envios após a qual a execução é encerrada.
+        [type: int, default=None]
+
+    :param poll_interval:
+        Intervalo máximo (em segundos) entre verificações da
+        fila enquanto não há mensagens a serem liberadas.
+        [type: float, default=5.0]
+
+    :param retry_delay:
+        Tempo (em segundos) até uma nova tentativa de envio.
+        [type: float, default=60]
+
+    :param max_attempts:
+        Quantidade máxima de tentativas de envio por mensagem.
+        [type: int, default=3]
+
+    :param send_func:
+        Função utilizada no envio das mensagens.
+        [type: callable, default=send_mail]
+
+    :param **send_kwargs:
+        Parâmetros adicionais repassados à função de envio, como
+        "username", "password", "server" e "mail_box".
+
+    Retorno
+    -------
+    :return sent:
+        Quantidade de mensagens enviadas durante a execução.
+        [type: int]
+    """
+
+    conn = _open_queue(queue_path)
+    tokens = burst
+    last_refill = time.monotonic()
+    sent = 0
+    try:
+        while max_messages is None or sent < max_messages:
+            # Próxima mensagem não reservada da fila em ordem de entrega
+            row = conn.execute(
+                'SELECT id, deliver_at, attempts, claimed_until, message FROM pending '
+                'WHERE claimed_until IS NULL OR claimed_until <= ? '
+                'ORDER BY deliver_at, id LIMIT 1',
+                (time.time(),)
+            ).fetchone()
+            if row is None:
+                if run_until_empty:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            # Aguardando horário de entrega
+            message_id, deliver_at, attempts, claimed_until, message = row
+            wait = deliver_at - time.time()
+            if wait > 0:
+                time.sleep(min(wait, poll_interval))
+                continue
+
+            # Aguardando liberação pela taxa máxima de envios
+            now = time.monotonic()
+            tokens = min(burst, tokens + (now - last_refill) * rate)
+            last_refill = now
+            if tokens < 1:
+                time.sleep((1 - tokens) / rate)
+                continue
+            tokens -= 1
+
+            # Descartando mensagens cujas reservas expiraram no limite de tentativas
+            if attempts >= max_attempts:
+                with conn:
+                    conn.execute(
+                        'DELETE FROM pending WHERE id = ? AND claimed_until IS ?',
+                        (message_id, claimed_until)
+                    )
+                print(f'Mensagem {message_id} interrompida após {attempts} tentativas. Mensagem descartada')
+                tokens += 1
+                continue
+
+            # Reservando mensagem para evitar envios por outras instâncias
+            with conn:
+                claimed = conn.execute(
+                    'UPDATE pending SET claimed_until = ?, attempts = attempts + 1 '
+                    'WHERE id = ? AND claimed_until IS ?',
+                    (time.time() + retry_delay, message_id, claimed_until)
+                ).rowcount
+            if not claimed:
+                tokens += 1
+                continue
+            attempts += 1
+
+            # Enviando mensagem e atualizando fila
+            try:
+                send_func(**send_kwargs, **_load_message(message))
+            except Exception as e:
+                with conn:
+                    if attempts >= max_attempts:
+                        conn.execute('DELETE FROM pending WHERE id = ?', (message_id,))
+                        print(f'Falha no envio da mensagem {message_id} após {attempts} tentativas. Mensagem descartada. Exception: {e}')
+                    else:
+                        conn.execute(
+                            'UPDATE pending SET deliver_at = ?, claimed_until = NULL WHERE id = ?',
+                            (time.time() + retry_delay, message_id)
+                        )
+                continue
+
+            with conn:
+                conn.execute('DELETE FROM pending WHERE id = ?', (message_id,))
+            sent += 1
+    finally:
+        conn.close()
+
+    return sent
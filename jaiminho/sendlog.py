@@ -0,0 +1,232 @@
+"""
+---------------------------------------------------
+---------------- MÓDULO: sendlog ------------------
+---------------------------------------------------
+Dentro da proposta do pacote jaiminho, este módulo
+oferece uma camada opcional de idempotência para o
+envio de e-mails. Cada mensagem é identificada por
+uma chave calculada a partir da caixa remetente, do
+título, dos destinatários, do corpo e do conteúdo dos
+anexos, sendo registrada em um
+log de envios local (SQLite) indexado pela própria
+chave. Dessa forma, reexecuções de rotinas agendadas
+podem verificar, a partir de uma consulta local, se
+uma mensagem idêntica já foi enviada recentemente e
+evitar envios duplicados.
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+2. Log de envios
+    2.1 Chave de idempotência
+    2.2 Consulta e registro de envios
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas gerais
+from hashlib import sha256
+import sqlite3
+import time
+
+
+"""
+---------------------------------------------------
+---------------- 2. LOG DE ENVIOS -----------------
+            2.1 Chave de idempotência
+---------------------------------------------------
+"""
+
+# Calculando chave de idempotência da mensagem
+def message_key(mail_box, mail_to, subject, body, attachments=None):
+    """
+    Calcula a chave de idempotência de uma mensagem a partir
+    da caixa remetente, de seu título, destinatários, corpo e
+    anexos. Os anexos contribuem com seus nomes e com o hash de
+    seus conteúdos, enquanto a ordem e a caixa (maiúsculas e
+    minúsculas) dos endereços são desconsideradas. Assim, um
+    mesmo log pode ser compartilhado por rotinas que enviam
+    conteúdos idênticos a partir de caixas diferentes.
+
+    Parâmetros
+    ----------
+    :param mail_box:
+        Caixa de e-mail remetente da mensagem.
+        [type: string]
+
+    :param mail_to:
+        Lista de destinatários da mensagem.
+        [type: list]
+
+    :param subject:
+        Título da mensagem.
+        [type: string]
+
+    :param body:
+        Corpo da mensagem.
+        [type: string]
+
+    :param attachments:
+        Lista de tuplas (nome, conteúdo em bytes) dos anexos.
+        [type: list, default=None]
+
+    Retorno
+    -------
+    :return key:
+        Hash SHA-256 de 32 bytes que identifica a mensagem.
+        [type: bytes]
+    """
+
+    h = sha256()
+
+    # Cada campo é prefixado pelo seu tamanho para evitar ambiguidades
+    def update(value):
+        value = value if type(value) is bytes else str(value).encode('utf-8')
+        h.update(len(value).to_bytes(8, 'big'))
+        h.update(value)
+
+    update(mail_box.strip().lower())
+    update(subject)
+    update(body)
+    recipients = sorted(address.strip().lower() for address in mail_to)
+    update(len(recipients))
+    for address in recipients:
+        update(address)
+    for name, content in (attachments or []):
+        update(name)
+        update(sha256(content or b'').digest())
+
+    return h.digest()
+
+
+"""
+---------------------------------------------------
+---------------- 2. LOG DE ENVIOS -----------------
+        2.2 Consulta e registro de envios
+---------------------------------------------------
+"""
+
+# Abrindo log de envios local
+def open_send_log(path):
+    """
+    Abre (ou cria) o log de envios local em um arquivo SQLite.
+    As chaves são armazenadas em uma tabela WITHOUT ROWID, de
+    modo que o próprio índice da chave primária armazene os
+    registros de forma compacta.
+
+    Parâmetros
+    ----------
+    :param path:
+        Caminho do arquivo SQLite do log de envios.
+        [type: string]
+
+    Retorno
+    -------
+    :return conn:
+        Conexão com o log de envios.
+        [type: sqlite3.Connection]
+    """
+
+    conn = sqlite3.connect(path, timeout=30)
+    with conn:
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS send_log ('
+            'key BLOB PRIMARY KEY, sent_at REAL NOT NULL) WITHOUT ROWID'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS send_log_sent_at ON send_log (sent_at)')
+
+    return conn
+
+# Verificando se a mensagem já foi enviada
+def was_sent(conn, key, window=None):
+    """
+    Verifica se uma mensagem com a chave fornecida foi enviada
+    dentro da janela de tempo informada.
+
+    Parâmetros
+    ----------
+    :param conn:
+        Conexão com o log de envios.
+        [type: sqlite3.Connection]
+
+    :param key:
+        Chave de idempotência da mensagem.
+        [type: bytes]
+
+    :param window:
+        Janela de tempo (em segundos) considerada. Caso seja
+        None, qualquer envio anterior é considerado.
+        [type: float, default=None]
+
+    Retorno
+    -------
+    :return sent:
+        Flag indicando se a mensagem já foi enviada.
+        [type: bool]
+    """
+
+    row = conn.execute('SELECT sent_at FROM send_log WHERE key = ?', (key,)).fetchone()
+    if row is None:
+        return False
+
+    return window is None or time.time() - row[0] <= window
+
+# Registrando envio da mensagem
+def record_send(conn, key):
+    """
+    Registra o envio de uma mensagem no log de envios com o
+    horário atual.
+
+    Parâmetros
+    ----------
+    :param conn:
+        Conexão com o log de envios.
+        [type: sqlite3.Connection]
+
+    :param key:
+        Chave de idempotência da mensagem.
+        [type: bytes]
+    """
+
+    with conn:
+        conn.execute('INSERT OR REPLACE INTO send_log (key, sent_at) VALUES (?, ?)',
+                     (key, time.time()))
+
+# Removendo registros antigos
+def prune_send_log(conn, window):
+    """
+    Remove do log de envios os registros mais antigos que a
+    janela de tempo informada, mantendo o arquivo compacto.
+
+    Parâmetros
+    ----------
+    :param conn:
+        Conexão com o log de envios.
+        [type: sqlite3.Connection]
+
+    :param window:
+        Janela de tempo (em segundos) a ser mantida.
+        [type: float]
+
+    Retorno
+    -------
+    :return removed:
+        Quantidade de registros removidos.
+        [type: int]
+    """
+
+    with conn:
+        cursor = conn.execute('DELETE FROM send_log WHERE sent_at < ?', (time.time() - window,))
+
+    return cursor.rowcount
@@ -47,6 +47,9 @@ setup(
         'pretty-html-table',
         'tzlocal==3.0'
     ],
+    extras_require={
+        'async': ['aiohttp']
+    },
     license='MIT',
     description='Solução de gerenciamento e envio de e-mails',
     long_description=__long_description__,
@@ -0,0 +1,277 @@
+"""
+---------------------------------------------------
+----------- TESTS: async_exchange_tests -----------
+---------------------------------------------------
+
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+    1.2 Iniciando servidor EWS local
+2. Testando funcionalidades
+    2.1 Envio assíncrono de mensagem simples
+    2.2 Envio assíncrono com anexos
+    2.3 Envio concorrente de múltiplas mensagens
+    2.4 Reaproveitando anexos pré-codificados
+    2.5 Envio de conteúdo MIME bruto
+    2.6 Mapeamento de falhas SOAP do servidor
+    2.7 Parâmetros inválidos sem sessão aberta
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades
+import jaiminho.async_exchange as jax
+from jaiminho.mock_server import start_mock_ews_server
+
+# Erros da biblioteca exchangelib
+from exchangelib.errors import ErrorServerBusy, ErrorSchemaValidation, SOAPError
+
+# Bibliotecas padrão
+import asyncio
+from base64 import b64decode
+import email
+import pandas as pd
+import re
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+        1.2 Iniciando servidor EWS local
+---------------------------------------------------
+"""
+
+# Servidor local armazenando payloads recebidos
+server = start_mock_ews_server(keep_payloads=True)
+SERVER = server.url
+MAIL_USERNAME = 'jaiminho'
+PASSWORD = 'tangamandapio'
+MAIL_BOX = 'jaiminho@tangamandapio.com'
+MAIL_TO = ['chaves@tangamandapio.com', 'quico@tangamandapio.com']
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+    2.1 Envio assíncrono de mensagem simples
+---------------------------------------------------
+"""
+
+# Enviando mensagem com sessão temporária
+asyncio.run(jax.send_mail_async(
+    username=MAIL_USERNAME,
+    password=PASSWORD,
+    server=SERVER,
+    mail_box=MAIL_BOX,
+    mail_to=MAIL_TO,
+    subject='[Jaiminho] async_exchange_tests.py [1] - Mensagem Simples',
+    body='Enviando mensagem simples via send_mail_async() & cia'
+))
+assert server.requests == 1, f'Servidor deveria ter recebido 1 requisição, mas recebeu {server.requests}'
+payload = server.payloads[-1].decode('utf-8')
+assert 'MessageDisposition="SendAndSaveCopy"' in payload, 'Payload não corresponde a um CreateItem com envio'
+assert '&amp; cia' in payload, 'Corpo da mensagem não foi escapado corretamente no payload'
+assert all(address in payload for address in MAIL_TO), 'Destinatários ausentes no payload'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+          2.2 Envio assíncrono com anexos
+---------------------------------------------------
+"""
+
+# Anexando bytes e DataFrame
+df = pd.DataFrame({'player_name': ['Damian Lillard'], 'player_team': ['POR']})
+asyncio.run(jax.send_mail_async(
+    username=MAIL_USERNAME,
+    password=PASSWORD,
+    server=SERVER,
+    mail_box=MAIL_BOX,
+    mail_to=MAIL_TO,
+    subject='[Jaiminho] async_exchange_tests.py [2] - Anexos',
+    body='Enviando mensagem com anexos via send_mail_async()',
+    zip_attachments=zip(['bytes.txt', 'df.csv'], [b'jaiminho', df])
+))
+payload = server.payloads[-1].decode('utf-8')
+assert payload.count('<t:FileAttachment>') == 2, 'Anexos ausentes no payload'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+  2.3 Envio concorrente de múltiplas mensagens
+---------------------------------------------------
+"""
+
+# Enviando milhares de mensagens a partir de um gerador
+N_MESSAGES = 2000
+server.requests = 0
+server.keep_payloads = False
+messages = (
+    {
+        'mail_to': MAIL_TO,
+        'subject': f'[Jaiminho] async_exchange_tests.py [3] - Mensagem {i}',
+        'body': 'Envio concorrente via send_many_async()'
+    } for i in range(N_MESSAGES)
+)
+results = asyncio.run(jax.send_many_async(
+    username=MAIL_USERNAME,
+    password=PASSWORD,
+    server=SERVER,
+    mail_box=MAIL_BOX,
+    messages=messages,
+    max_concurrency=500,
+    max_connections=50
+))
+errors = [r for r in results if r is not None]
+assert len(results) == N_MESSAGES, f'Total de resultados ({len(results)}) difere do esperado ({N_MESSAGES})'
+assert not errors, f'Envio concorrente falhou em {len(errors)} mensagens. Exemplo: {errors[0]!r}'
+assert server.requests == N_MESSAGES, f'Servidor recebeu {server.requests} requisições de {N_MESSAGES}'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+     2.4 Reaproveitando anexos pré-codificados
+---------------------------------------------------
+"""
+
+# Codificando relatório uma única vez e enviando para diferentes destinatários
+report = jax.prepare_attachment(df)
+server.keep_payloads = True
+messages = [
+    {
+        'mail_to': [address],
+        'subject': '[Jaiminho] async_exchange_tests.py [4] - Anexo Pré-Codificado',
+        'body': 'Envio de anexo pré-codificado via prepare_attachment()',
+        'zip_attachments': [('relatorio.csv', report)]
+    } for address in MAIL_TO
+]
+results = asyncio.run(jax.send_many_async(
+    username=MAIL_USERNAME,
+    password=PASSWORD,
+    server=SERVER,
+    mail_box=MAIL_BOX,
+    messages=messages
+))
+assert results == [None] * len(MAIL_TO), f'Envio com anexo pré-codificado falhou: {results}'
+for payload in server.payloads[-len(MAIL_TO):]:
+    content = re.search(rb'<t:Content>(.*?)</t:Content>', payload, re.S).group(1)
+    assert b64decode(content) == df.to_csv().encode('utf-8'), 'Conteúdo do anexo pré-codificado divergente no payload'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+         2.5 Envio de conteúdo MIME bruto
+---------------------------------------------------
+"""
+
+# Enviando mensagem como MimeContent
+asyncio.run(jax.send_mail_async(
+    username=MAIL_USERNAME,
+    password=PASSWORD,
+    server=SERVER,
+    mail_box=MAIL_BOX,
+    mail_to=MAIL_TO,
+    subject='[Jaiminho] async_exchange_tests.py [5] - Conteúdo MIME',
+    body='Envio de mensagem como conteúdo MIME bruto',
+    zip_attachments=[('relatorio.csv', report), ('bytes.txt', b'jaiminho'), ('rel"x.csv', df)],
+    raw_mime=True
+))
+mime_content = re.search(rb'<t:MimeContent[^>]*>(.*?)</t:MimeContent>', server.payloads[-1], re.S).group(1)
+raw = b64decode(mime_content)
+assert raw.count(b'\n') == raw.count(b'\r\n'), 'Conteúdo MIME deveria utilizar apenas quebras de linha CRLF'
+mime = email.message_from_bytes(raw)
+filenames = [part.get_filename() for part in mime.walk() if part.get_filename()]
+assert filenames == ['relatorio.csv', 'bytes.txt', 'rel"x.csv'], f'Anexos ausentes no conteúdo MIME: {filenames}'
+contents = [part.get_payload(decode=True) for part in mime.walk() if part.get_filename()]
+assert contents[0] == contents[2] == df.to_csv().encode('utf-8'), 'Conteúdo dos anexos divergente no conteúdo MIME'
+assert mime['To'] == ', '.join(MAIL_TO), 'Destinatários ausentes no conteúdo MIME'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+     2.6 Mapeamento de falhas SOAP do servidor
+---------------------------------------------------
+"""
+
+# Envelope de falha no formato retornado pelo Exchange (HTTP 500)
+def soap_fault(code, message, message_xml=''):
+    return (
+        f'<s:Envelope xmlns:s="{jax.NS_SOAP}"><s:Body><s:Fault>'
+        f'<faultcode xmlns:a="{jax.NS_TYPES}">a:{code}</faultcode>'
+        f'<faultstring xml:lang="en-US">{message}</faultstring>'
+        f'<detail><e:ResponseCode xmlns:e="{jax.NS_ERRORS}">{code}</e:ResponseCode>'
+        f'<e:Message xmlns:e="{jax.NS_ERRORS}">{message}</e:Message>'
+        f'<t:MessageXml xmlns:t="{jax.NS_TYPES}">{message_xml}</t:MessageXml>'
+        '</detail></s:Fault></s:Body></s:Envelope>'
+    ).encode('utf-8')
+
+# Throttling com tempo de espera solicitado pelo servidor
+try:
+    jax.check_ews_response(500, soap_fault(
+        'ErrorServerBusy', 'The server cannot service this request right now.',
+        '<t:Value Name="BackOffMilliseconds">2500</t:Value>'
+    ))
+    raise AssertionError('ErrorServerBusy não levantado para soap:Fault')
+except ErrorServerBusy as e:
+    assert e.back_off == 2.5, f'Tempo de espera incorreto: {e.back_off}'
+
+# Erros de schema com detalhes da violação
+try:
+    jax.check_ews_response(500, soap_fault(
+        'ErrorSchemaValidation', 'The request failed schema validation.',
+        '<t:Violation>Elemento inválido</t:Violation>'
+    ))
+    raise AssertionError('ErrorSchemaValidation não levantado para soap:Fault')
+except ErrorSchemaValidation as e:
+    assert 'Elemento inválido' in str(e), 'Detalhes da violação ausentes na mensagem de erro'
+
+# Falhas sem código conhecido
+try:
+    jax.check_ews_response(500, soap_fault('ErrorJaiminhoDesconhecido', 'Falha desconhecida'))
+    raise AssertionError('SOAPError não levantado para soap:Fault desconhecido')
+except SOAPError:
+    pass
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+    2.7 Parâmetros inválidos sem sessão aberta
+---------------------------------------------------
+"""
+
+# Erros na construção da requisição ocorrem antes da criação da sessão temporária
+sessions = []
+create_session = jax.create_session
+jax.create_session = lambda **kwargs: sessions.append(kwargs) or create_session(**kwargs)
+try:
+    asyncio.run(jax.send_mail_async(username=MAIL_USERNAME, password=PASSWORD, server=SERVER,
+                                    mail_box=MAIL_BOX, mail_to=MAIL_TO, subject=None,
+                                    body='Mensagem sem título'))
+    raise AssertionError('Título inválido deveria gerar erro')
+except AttributeError:
+    pass
+finally:
+    jax.create_session = create_session
+assert sessions == [], 'Sessão temporária criada para requisição inválida'
+
+# Encerrando servidor local
+server.shutdown()
+server.server_close()
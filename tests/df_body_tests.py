@@ -0,0 +1,147 @@
+"""
+---------------------------------------------------
+-------------- TESTS: df_body_tests ---------------
+---------------------------------------------------
+
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+    1.2 Definindo DataFrames para testes
+2. Testando funcionalidades
+    2.1 Limite de tamanho do corpo
+    2.2 Limite de linhas exibidas
+    2.3 Resumo estatístico
+    2.4 DataFrames vazios e sem colunas
+    2.5 DataFrames muito largos
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades
+from jaiminho.exchange import build_df_body
+
+# Bibliotecas padrão
+import gzip
+from io import BytesIO
+import pandas as pd
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+      1.2 Definindo DataFrames para testes
+---------------------------------------------------
+"""
+
+# DataFrame grande o suficiente para exceder o limite do corpo
+N_ROWS = 5000
+df = pd.DataFrame({
+    'player_name': [f'Jogador {i}' for i in range(N_ROWS)],
+    'player_team': ['POR', 'LAL', 'GSW', 'BOS', 'MIA'] * (N_ROWS // 5),
+    'points': [i % 50 for i in range(N_ROWS)],
+    'ratio': [i / 7 for i in range(N_ROWS)]
+})
+
+# Lendo anexo compactado de volta em um DataFrame
+def read_attachment(attachments):
+    name, content = attachments[0]
+    return name, pd.read_csv(BytesIO(gzip.decompress(content)), index_col=0)
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+          2.1 Limite de tamanho do corpo
+---------------------------------------------------
+"""
+
+# Corpo limitado com dados completos em anexo
+MAX_BYTES = 100000
+body, attachments = build_df_body(df, max_bytes=MAX_BYTES, attachment_name='jogadores.csv.gz')
+shown_rows = body.count('<tr>')
+assert len(body.encode('utf-8')) <= MAX_BYTES, f'Corpo gerado ({len(body.encode("utf-8"))} bytes) excede o limite de {MAX_BYTES} bytes'
+assert 0 < shown_rows < N_ROWS, f'Quantidade de linhas exibidas inesperada: {shown_rows}'
+assert f'Exibindo as primeiras {shown_rows} de {N_ROWS} linhas' in body, 'Aviso de linhas exibidas ausente no corpo'
+name, df_attached = read_attachment(attachments)
+assert name == 'jogadores.csv.gz', f'Nome do anexo incorreto: {name}'
+pd.testing.assert_frame_equal(df_attached, df)
+
+# DataFrame que cabe integralmente no corpo dispensa anexo
+body, attachments = build_df_body(df.head(10), max_bytes=MAX_BYTES)
+assert attachments == [], 'Anexo gerado para DataFrame que cabe no corpo'
+assert body.count('<tr>') == 10, 'Todas as linhas deveriam ser exibidas no corpo'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+           2.2 Limite de linhas exibidas
+---------------------------------------------------
+"""
+
+# Limite de linhas não múltiplo do tamanho das partes
+body, attachments = build_df_body(df, max_rows=150, chunk_rows=100)
+assert body.count('<tr>') == 150, f'Quantidade de linhas exibidas ({body.count("<tr>")}) difere do limite'
+assert 'Exibindo as primeiras 150 de' in body, 'Aviso de linhas exibidas ausente no corpo'
+pd.testing.assert_frame_equal(read_attachment(attachments)[1], df)
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+              2.3 Resumo estatístico
+---------------------------------------------------
+"""
+
+# Resumo estatístico no corpo e dados completos em anexo
+body, attachments = build_df_body(df, summary=True)
+assert f'Resumo estatístico de {N_ROWS} linhas' in body, 'Aviso de resumo ausente no corpo'
+assert 'mean' in body and 'Jogador 0' not in body, 'Corpo deveria conter apenas o resumo estatístico'
+pd.testing.assert_frame_equal(read_attachment(attachments)[1], df)
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+       2.4 DataFrames vazios e sem colunas
+---------------------------------------------------
+"""
+
+# DataFrame sem linhas gera tabela vazia com cabeçalho
+body, attachments = build_df_body(df.head(0))
+assert attachments == [], 'Anexo gerado para DataFrame vazio'
+assert '<table' in body and 'player_name' in body and body.count('<tr>') == 0, 'Tabela vazia com cabeçalho esperada'
+
+# DataFrame sem colunas, com ou sem resumo estatístico
+for summary in (False, True):
+    body, attachments = build_df_body(pd.DataFrame(index=range(3)), summary=summary)
+    assert body == '<p>DataFrame sem colunas (3 linhas).</p>' and attachments == [], f'Retorno inesperado: {body!r}'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+           2.5 DataFrames muito largos
+---------------------------------------------------
+"""
+
+# Cabeçalho e resumo estatístico maiores que o limite do corpo
+MAX_BYTES = 50000
+df_wide = pd.DataFrame({f'coluna_{i}': range(5) for i in range(3000)})
+for summary in (False, True):
+    body, attachments = build_df_body(df_wide, max_bytes=MAX_BYTES, summary=summary)
+    assert len(body.encode('utf-8')) <= MAX_BYTES, f'Corpo gerado ({len(body.encode("utf-8"))} bytes) excede o limite de {MAX_BYTES} bytes (summary={summary})'
+    assert 'excede o limite do corpo' in body, 'Aviso de tabela acima do limite ausente no corpo'
+    pd.testing.assert_frame_equal(read_attachment(attachments)[1], df_wide)
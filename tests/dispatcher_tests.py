@@ -0,0 +1,207 @@
+"""
+---------------------------------------------------
+------------- TESTS: dispatcher_tests -------------
+---------------------------------------------------
+
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+    1.2 Definindo função de envio para testes
+2. Testando funcionalidades
+    2.1 Envio distribuído entre múltiplas caixas
+    2.2 Envio distribuído com limite por caixa
+    2.3 Envio distribuído via exchangelib
+    2.4 Encerramento abrupto de processos
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades
+import jaiminho.async_exchange as jax
+import jaiminho.exchange as jex
+from jaiminho.dispatcher import send_sharded
+from jaiminho.mock_server import start_mock_ews_server
+
+# Bibliotecas padrão
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+     1.2 Definindo função de envio para testes
+---------------------------------------------------
+"""
+
+# Envio via servidor EWS local (definido no módulo para uso nos processos)
+def mock_send(username, password, server, mail_box, mail_to, subject, body,
+              zip_attachments=None):
+    asyncio.run(jax.send_mail_async(
+        username=username,
+        password=password,
+        server=server,
+        mail_box=mail_box,
+        mail_to=mail_to,
+        subject=subject,
+        body=body,
+        zip_attachments=zip_attachments
+    ))
+
+# Processo encerrado abruptamente, sem sinalizar o fim dos envios
+def dying_send(**kwargs):
+    os._exit(1)
+
+
+# Processos podem reimportar este script, portanto os testes ficam protegidos
+if __name__ == '__main__':
+
+    # Servidor local e credenciais de diferentes caixas de e-mail
+    server = start_mock_ews_server()
+    CREDENTIALS = [
+        {
+            'username': f'jaiminho{i}',
+            'password': 'tangamandapio',
+            'server': server.url,
+            'mail_box': f'jaiminho{i}@tangamandapio.com'
+        } for i in range(3)
+    ]
+    MAIL_TO = ['chaves@tangamandapio.com']
+
+
+    """
+    ---------------------------------------------------
+    ----------- 2. TESTANDO FUNCIONALIDADES -----------
+      2.1 Envio distribuído entre múltiplas caixas
+    ---------------------------------------------------
+    """
+
+    # Enviando mensagens fornecidas por um gerador
+    N_MESSAGES = 300
+    messages = (
+        {
+            'mail_to': MAIL_TO,
+            'subject': f'[Jaiminho] dispatcher_tests.py [1] - Mensagem {i}',
+            'body': 'Envio distribuído via send_sharded()',
+            'zip_attachments': [('jaiminho.txt', b'jaiminho')]
+        } for i in range(N_MESSAGES)
+    )
+    progress = []
+    summary = send_sharded(
+        credentials=CREDENTIALS,
+        messages=messages,
+        queue_size=50,
+        progress_callback=lambda s: progress.append(s['sent']),
+        send_func=mock_send
+    )
+    assert summary['sent'] == N_MESSAGES, f'Total enviado ({summary["sent"]}) difere do esperado ({N_MESSAGES}). Erros: {summary["errors"][:3]}'
+    assert summary['failed'] == 0, f'Envio distribuído falhou em {summary["failed"]} mensagens'
+    assert server.requests == N_MESSAGES, f'Servidor recebeu {server.requests} requisições de {N_MESSAGES}'
+    assert sum(s['sent'] for s in summary['per_mailbox'].values()) == N_MESSAGES, 'Resumo por caixa inconsistente'
+    assert len(progress) == N_MESSAGES, 'Callback de progresso deveria ser chamado a cada mensagem'
+
+
+    """
+    ---------------------------------------------------
+    ----------- 2. TESTANDO FUNCIONALIDADES -----------
+       2.2 Envio distribuído com limite por caixa
+    ---------------------------------------------------
+    """
+
+    # Cada caixa limitada a 20 envios por segundo
+    N_MESSAGES = 60
+    RATE_LIMIT = 20
+    summary = send_sharded(
+        credentials=CREDENTIALS,
+        messages=[{'mail_to': MAIL_TO, 'subject': f'[Jaiminho] dispatcher_tests.py [2] - Mensagem {i}',
+                   'body': 'Envio distribuído com limite'} for i in range(N_MESSAGES)],
+        rate_limit=RATE_LIMIT,
+        send_func=mock_send
+    )
+    assert summary['sent'] == N_MESSAGES, f'Total enviado ({summary["sent"]}) difere do esperado ({N_MESSAGES})'
+    assert summary['throughput'] <= RATE_LIMIT * len(CREDENTIALS) * 1.1, f'Vazão ({summary["throughput"]:.1f}/s) excede o limite somado das caixas'
+
+
+    """
+    ---------------------------------------------------
+    ----------- 2. TESTANDO FUNCIONALIDADES -----------
+         2.3 Envio distribuído via exchangelib
+    ---------------------------------------------------
+    """
+
+    # Caixas acessadas por uma mesma conta de serviço já utilizada no processo pai
+    SERVICE_CREDENTIALS = [dict(c, username='jaiminho') for c in CREDENTIALS[:2]]
+    jex.send_mail(
+        mail_to=MAIL_TO,
+        subject='[Jaiminho] dispatcher_tests.py [3] - Processo pai',
+        body='Envio prévio via send_mail() no processo pai',
+        **SERVICE_CREDENTIALS[0]
+    )
+
+    # Conexões abertas pela exchangelib no processo pai não devem ser compartilhadas
+    N_MESSAGES = 6
+    summary = send_sharded(
+        credentials=SERVICE_CREDENTIALS,
+        messages=[{'mail_to': MAIL_TO, 'subject': f'[Jaiminho] dispatcher_tests.py [3] - Mensagem {i}',
+                   'body': 'Envio distribuído via exchangelib',
+                   'zip_attachments': [('jaiminho.txt', b'jaiminho')]} for i in range(N_MESSAGES)]
+    )
+    assert summary['sent'] == N_MESSAGES, f'Total enviado ({summary["sent"]}) difere do esperado ({N_MESSAGES}). Erros: {summary["errors"][:3]}'
+
+
+    """
+    ---------------------------------------------------
+    ----------- 2. TESTANDO FUNCIONALIDADES -----------
+         2.4 Encerramento abrupto de processos
+    ---------------------------------------------------
+    """
+
+    # Execução deve ser finalizada mesmo com a fila cheia e sem processos ativos
+    N_MESSAGES = 100
+    start = time.monotonic()
+    summary = send_sharded(
+        credentials=CREDENTIALS,
+        messages=({'mail_to': MAIL_TO, 'subject': f'Mensagem {i}', 'body': 'Falha'} for i in range(N_MESSAGES)),
+        queue_size=5,
+        send_func=dying_send
+    )
+    assert time.monotonic() - start < 20, 'Execução não finalizada após encerramento dos processos'
+    assert summary['sent'] == 0 and summary['failed'] == N_MESSAGES, f'Mensagens não enviadas deveriam ser falhas: {summary["failed"]}'
+    assert sum('exitcode=1' in error for _, _, error in summary['errors']) == len(CREDENTIALS), 'Encerramento dos processos não reportado'
+
+    # Mensagens grandes pendentes na fila não devem impedir o encerramento do interpretador
+    script = f"""
+import sys
+sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})
+from dispatcher_tests import dying_send
+from jaiminho.dispatcher import send_sharded
+if __name__ == '__main__':
+    messages = ({{'mail_to': ['chaves@tangamandapio.com'], 'subject': str(i), 'body': 'x' * 200000}} for i in range(100))
+    summary = send_sharded([{{'username': 'j', 'password': 'p', 'server': 's', 'mail_box': f'j{{i}}'}} for i in range(2)],
+                           messages, queue_size=20, send_func=dying_send)
+    print(summary['failed'])
+"""
+    try:
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, timeout=60)
+    except subprocess.TimeoutExpired:
+        raise AssertionError('Interpretador não encerrado após a morte dos processos com a fila cheia')
+    assert result.returncode == 0 and result.stdout.strip() == '100', f'Execução inesperada: {result.stdout} {result.stderr[-500:]}'
+
+    # Encerrando servidor local
+    server.shutdown()
+    server.server_close()
@@ -18,6 +18,8 @@ Table of Contents
     2.6 Envio de e-mail utilizando função única
     2.7 Utilizando função única com anexos
     2.8 Utilizando função única com imagem no body
+    2.9 Enviando DataFrames grandes com limite de tamanho
+    2.10 Evitando envios duplicados com log de envios
 ---------------------------------------------------
 """
 
@@ -34,6 +36,7 @@ Table of Contents
 
 # Funcionalidades
 import jaiminho.exchange as jex
+from jaiminho.sendlog import message_key, open_send_log, was_sent
 from exchangelib.errors import UnauthorizedError
 
 # Bibliotecas padrão
@@ -285,4 +288,67 @@ jex.send_mail(
     body='Enviando e-mail a partir de método consolidado send_mail() com imagem e DataFrame no body:\n\n<img src="cid:Damian Lillard.png">\n\n' + df_html,
     zip_attachments=zip(['Damian Lillard.png'], [img]),
     send=True
-)
\ No newline at end of file
+)
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+ 2.9 Enviando DataFrames grandes com limite de tamanho
+---------------------------------------------------
+"""
+
+# Replicando DataFrame para simular uma tabela grande
+df_big = pd.concat([df] * 100, ignore_index=True)
+MAX_BYTES = 200000
+body, big_attachments = jex.build_df_body(df=df_big, max_bytes=MAX_BYTES)
+assert len(body.encode('utf-8')) <= MAX_BYTES, f'Corpo gerado ({len(body.encode("utf-8"))} bytes) excede o limite de {MAX_BYTES} bytes'
+assert len(big_attachments) == 1, 'Dados completos deveriam ter sido anexados de forma compactada'
+
+# Enviando e-mail com amostra no body e dados completos em anexo
+jex.send_mail(
+    username=MAIL_USERNAME,
+    password=os.getenv('PASSWORD'),
+    server=SERVER,
+    mail_box=MAIL_BOX,
+    mail_to=MAIL_TO,
+    subject='[Jaiminho] exchange_tests.py [9] - DataFrame Grande com Limite de Tamanho',
+    body='Enviando e-mail com amostra de DataFrame grande no body e dados completos compactados em anexo\n\n' + body,
+    zip_attachments=big_attachments,
+    send=True
+)
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+  2.10 Evitando envios duplicados com log de envios
+---------------------------------------------------
+"""
+
+# Log de envios local utilizado para idempotência
+SEND_LOG = os.path.join(PROJECT_PATH, 'jaiminho_send_log.db')
+if os.path.exists(SEND_LOG):
+    os.remove(SEND_LOG)
+SUBJECT = '[Jaiminho] exchange_tests.py [10] - Envio Idempotente'
+BODY = 'Enviando e-mail com log de envios. Reexecuções não devem gerar duplicatas'
+
+# Enviando a mesma mensagem duas vezes: apenas o primeiro envio é realizado
+for _ in range(2):
+    jex.send_mail(
+        username=MAIL_USERNAME,
+        password=os.getenv('PASSWORD'),
+        server=SERVER,
+        mail_box=MAIL_BOX,
+        mail_to=MAIL_TO,
+        subject=SUBJECT,
+        body=BODY,
+        zip_attachments=zip(['Damian Lillard.png'], [img]),
+        send_log=SEND_LOG
+    )
+log = open_send_log(SEND_LOG)
+key = message_key(MAIL_BOX, MAIL_TO, SUBJECT, BODY, [('Damian Lillard.png', img)])
+assert was_sent(log, key), 'Envio deveria estar registrado no log de envios'
+assert log.execute('SELECT COUNT(*) FROM send_log').fetchone()[0] == 1, 'Log de envios deveria conter apenas um registro'
+log.close()
+os.remove(SEND_LOG)
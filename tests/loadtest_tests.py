@@ -0,0 +1,209 @@
+"""
+---------------------------------------------------
+-------------- TESTS: loadtest_tests --------------
+---------------------------------------------------
+
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+    1.2 Iniciando servidor EWS local
+2. Testando funcionalidades
+    2.0 Cálculo de percentis
+    2.1 Carga sobre send_mail()
+    2.2 Carga sobre send_mail_async()
+    2.3 Limite de taxa de envio
+    2.4 Throttling e erros do servidor
+    2.5 Carga sobre APIs de envio em lote
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades
+from jaiminho.async_exchange import create_session, send_mail_async
+from jaiminho.exchange import send_mail
+from jaiminho.loadtest import run_load_test, run_load_test_async, run_batch_load_test, \
+                              batch_send_many_async, format_report, _percentile
+from jaiminho.mock_server import start_mock_ews_server
+
+# Bibliotecas padrão
+import asyncio
+from functools import partial
+import re
+import subprocess
+import sys
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+        1.2 Iniciando servidor EWS local
+---------------------------------------------------
+"""
+
+# Servidor local com latência simulada
+server = start_mock_ews_server(latency=0.01, jitter=0.01, seed=42)
+CREDENTIALS = {
+    'username': 'jaiminho',
+    'password': 'tangamandapio',
+    'server': server.url,
+    'mail_box': 'jaiminho@tangamandapio.com'
+}
+
+# Executando teste de carga assíncrono com sessão compartilhada
+def run_async(n_messages, concurrency, **kwargs):
+    async def run():
+        session = create_session(CREDENTIALS['username'], CREDENTIALS['password'],
+                                 max_connections=concurrency)
+        try:
+            return await run_load_test_async(
+                partial(send_mail_async, session=session, **CREDENTIALS),
+                n_messages=n_messages, concurrency=concurrency, **kwargs
+            )
+        finally:
+            await session.close()
+    return asyncio.run(run())
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+             2.0 Cálculo de percentis
+---------------------------------------------------
+"""
+
+# Percentis pelo método nearest-rank em listas conhecidas
+values = list(range(1, 11))
+assert [_percentile(values, q) for q in (50, 90, 99, 100)] == [5, 9, 10, 10], 'Percentis incorretos para 10 valores'
+values = list(range(1, 101))
+assert [_percentile(values, q) for q in (50, 90, 99, 100)] == [50, 90, 99, 100], 'Percentis incorretos para 100 valores'
+assert _percentile([], 50) == 0.0 and _percentile([7], 99) == 7, 'Percentis incorretos para listas pequenas'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+           2.1 Carga sobre send_mail()
+---------------------------------------------------
+"""
+
+# Poucas mensagens via exchangelib, que realiza múltiplas requisições por envio
+N_MESSAGES = 10
+report = run_load_test(partial(send_mail, **CREDENTIALS), n_messages=N_MESSAGES,
+                       concurrency=5, trace_memory=True)
+print(format_report(report))
+assert report['sent'] == N_MESSAGES, f'Envios com falha: {report["errors"]}'
+assert report['latency_ms']['p50'] <= report['latency_ms']['p99'] <= report['latency_ms']['max'], 'Percentis de latência inconsistentes'
+assert report['latency_ms']['p50'] >= 10, 'Latência do servidor não refletida no relatório'
+assert report['peak_memory_mb'] > 0, 'Pico de memória não medido'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+         2.2 Carga sobre send_mail_async()
+---------------------------------------------------
+"""
+
+# Alta concorrência com uma única requisição por envio
+N_MESSAGES = 1000
+server.requests = 0
+report = run_async(N_MESSAGES, concurrency=200)
+print(format_report(report))
+assert report['sent'] == N_MESSAGES, f'Envios com falha: {report["errors"]}'
+assert server.requests == N_MESSAGES, f'Servidor recebeu {server.requests} requisições de {N_MESSAGES}'
+assert report['throughput'] > 100, f'Vazão muito abaixo do esperado: {report["throughput"]:.1f} mensagens/s'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+           2.3 Limite de taxa de envio
+---------------------------------------------------
+"""
+
+# Envios iniciados a no máximo 100 mensagens por segundo
+N_MESSAGES = 50
+RATE = 100
+report = run_async(N_MESSAGES, concurrency=50, rate=RATE)
+assert report['sent'] == N_MESSAGES, f'Envios com falha: {report["errors"]}'
+assert report['elapsed'] >= (N_MESSAGES - 1) / RATE * 0.9, f'Taxa não respeitada: {N_MESSAGES} envios em {report["elapsed"]:.2f}s'
+assert report['throughput'] <= RATE * 1.1, f'Vazão ({report["throughput"]:.1f}) acima da taxa configurada'
+server.shutdown()
+server.server_close()
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+        2.4 Throttling e erros do servidor
+---------------------------------------------------
+"""
+
+# Servidor limitado a 50 requisições por segundo e com 10% de erros
+N_MESSAGES = 300
+server = start_mock_ews_server(throttle_rate=50, error_rate=0.1, seed=42)
+CREDENTIALS['server'] = server.url
+report = run_async(N_MESSAGES, concurrency=100)
+print(format_report(report))
+assert report['sent'] + report['failed'] == N_MESSAGES, 'Mensagens ausentes no relatório'
+assert report['errors'].get('ErrorServerBusy') == server.throttled > 0, f'Throttling não reportado: {report["errors"]}'
+assert report['errors'].get('ErrorInternalServerError') == server.errors > 0, f'Erros não reportados: {report["errors"]}'
+server.shutdown()
+server.server_close()
+
+# Throttling (soap:Fault com HTTP 500) também reportado pelo envio via exchangelib
+N_MESSAGES = 20
+server = start_mock_ews_server(throttle_rate=5)
+CREDENTIALS['server'] = server.url
+report = run_load_test(partial(send_mail, **CREDENTIALS), n_messages=N_MESSAGES, concurrency=10)
+print(format_report(report))
+assert report['sent'] + report['failed'] == N_MESSAGES, 'Mensagens ausentes no relatório'
+assert report['errors'].get('ErrorServerBusy', 0) > 0 and server.throttled > 0, f'Throttling não reportado via send_mail(): {report["errors"]}'
+server.shutdown()
+server.server_close()
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+      2.5 Carga sobre APIs de envio em lote
+---------------------------------------------------
+"""
+
+# Envio concorrente via send_many_async() com erros injetados
+N_MESSAGES = 500
+server = start_mock_ews_server(error_rate=0.1, seed=42)
+CREDENTIALS['server'] = server.url
+report = run_batch_load_test(partial(batch_send_many_async, max_concurrency=100, **CREDENTIALS),
+                             n_messages=N_MESSAGES)
+print(format_report(report))
+assert report['latency_ms'] is None, 'Latência individual não disponível em envios em lote'
+assert report['sent'] + report['failed'] == N_MESSAGES, 'Mensagens ausentes no relatório'
+assert report['errors'].get('ErrorInternalServerError') == server.errors > 0, f'Erros não reportados: {report["errors"]}'
+assert report['throughput'] > 0, 'Vazão total não medida'
+server.shutdown()
+server.server_close()
+
+# Envio distribuído via send_sharded() pela linha de comando (processos exigem script próprio)
+N_MESSAGES = 20
+result = subprocess.run(
+    [sys.executable, '-m', 'jaiminho.loadtest', '--target', 'send_sharded',
+     '--messages', str(N_MESSAGES), '--mailboxes', '2'],
+    capture_output=True, text=True, timeout=120
+)
+print(result.stdout)
+assert result.returncode == 0, f'Execução via linha de comando falhou: {result.stderr[-500:]}'
+assert re.search(rf'Enviadas:\s+{N_MESSAGES}\b', result.stdout), 'Envios distribuídos não reportados'
+assert 'indisponível para envios em lote' in result.stdout, 'Relatório deveria indicar latência indisponível'
@@ -0,0 +1,219 @@
+"""
+---------------------------------------------------
+------------- TESTS: scheduler_tests --------------
+---------------------------------------------------
+
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+    1.2 Definindo função de envio para testes
+2. Testando funcionalidades
+    2.1 Agendamento e persistência da fila
+    2.2 Suavização de rajadas de envio
+    2.3 Reagendamento após falhas
+    2.4 Execução simultânea sobre uma mesma fila
+    2.5 Interrupções durante o envio
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades
+from jaiminho.scheduler import schedule_mail, run_scheduler
+
+# Bibliotecas padrão
+from datetime import datetime, timedelta
+import os
+import pandas as pd
+import sqlite3
+import json
+import tempfile
+from threading import Thread
+import time
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+     1.2 Definindo função de envio para testes
+---------------------------------------------------
+"""
+
+# Registrando envios em memória no lugar do servidor Exchange
+SENT = []
+def fake_send(mail_box, mail_to, subject, body, zip_attachments=None):
+    SENT.append((time.monotonic(), mail_box, subject, zip_attachments))
+
+QUEUE_PATH = os.path.join(tempfile.mkdtemp(), 'jaiminho_queue.db')
+MAIL_BOX = 'jaiminho@tangamandapio.com'
+MAIL_TO = ['chaves@tangamandapio.com']
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+      2.1 Agendamento e persistência da fila
+---------------------------------------------------
+"""
+
+# Agendando mensagens fora de ordem, uma delas com anexo em DataFrame
+df = pd.DataFrame({'player_name': ['Damian Lillard'], 'player_team': ['POR']})
+now = datetime.now()
+schedule_mail(QUEUE_PATH, MAIL_TO, 'segunda', 'Mensagem agendada', deliver_at=now + timedelta(seconds=0.6))
+schedule_mail(QUEUE_PATH, MAIL_TO, 'primeira', 'Mensagem agendada', deliver_at=now + timedelta(seconds=0.3),
+              zip_attachments=zip(['df.csv'], [df]))
+schedule_mail(QUEUE_PATH, MAIL_TO, 'amanhã', 'Mensagem agendada', deliver_at=now + timedelta(days=1))
+
+# Cada execução lê a fila persistida em disco, simulando reinicializações
+start = time.monotonic()
+for _ in range(2):
+    run_scheduler(QUEUE_PATH, rate=100, max_messages=1, poll_interval=0.05,
+                  send_func=fake_send, mail_box=MAIL_BOX)
+assert [s[2] for s in SENT] == ['primeira', 'segunda'], f'Ordem de envio incorreta: {[s[2] for s in SENT]}'
+assert SENT[0][0] - start >= 0.25, 'Mensagem enviada antes do horário de entrega'
+assert SENT[0][1] == MAIL_BOX, 'Parâmetros adicionais não repassados à função de envio'
+assert SENT[0][3] == [('df.csv', df.to_csv().encode('utf-8'))], 'Anexo não persistido corretamente na fila'
+
+# Mensagem agendada para o dia seguinte permanece na fila, serializada em JSON
+conn = sqlite3.connect(QUEUE_PATH)
+assert conn.execute('SELECT COUNT(*) FROM pending').fetchone()[0] == 1, 'Fila deveria conter apenas a mensagem futura'
+stored = json.loads(conn.execute('SELECT message FROM pending').fetchone()[0])
+assert stored['subject'] == 'amanhã', 'Mensagem não armazenada em JSON na fila'
+conn.execute('DELETE FROM pending')
+conn.commit()
+conn.close()
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+        2.2 Suavização de rajadas de envio
+---------------------------------------------------
+"""
+
+# Rajada de mensagens liberada a no máximo 20 envios por segundo
+N_MESSAGES = 11
+RATE = 20
+SENT.clear()
+for i in range(N_MESSAGES):
+    schedule_mail(QUEUE_PATH, MAIL_TO, f'rajada {i}', 'Mensagem em rajada')
+sent = run_scheduler(QUEUE_PATH, rate=RATE, run_until_empty=True, send_func=fake_send, mail_box=MAIL_BOX)
+elapsed = SENT[-1][0] - SENT[0][0]
+assert sent == N_MESSAGES, f'Total enviado ({sent}) difere do esperado ({N_MESSAGES})'
+assert elapsed >= (N_MESSAGES - 1) / RATE * 0.9, f'Rajada não suavizada: {N_MESSAGES} envios em {elapsed:.2f}s'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+          2.3 Reagendamento após falhas
+---------------------------------------------------
+"""
+
+# Função de envio que falha na primeira tentativa
+ATTEMPTS = []
+def flaky_send(**kwargs):
+    ATTEMPTS.append(time.monotonic())
+    if len(ATTEMPTS) == 1:
+        raise ConnectionError('Servidor indisponível')
+
+schedule_mail(QUEUE_PATH, MAIL_TO, 'instável', 'Mensagem com falha')
+sent = run_scheduler(QUEUE_PATH, rate=100, run_until_empty=True, retry_delay=0.2,
+                     poll_interval=0.05, send_func=flaky_send)
+assert sent == 1 and len(ATTEMPTS) == 2, f'Mensagem deveria ser enviada na segunda tentativa ({len(ATTEMPTS)} tentativas)'
+assert ATTEMPTS[1] - ATTEMPTS[0] >= 0.15, 'Nova tentativa realizada antes do intervalo configurado'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+   2.4 Execução simultânea sobre uma mesma fila
+---------------------------------------------------
+"""
+
+# Envio com duração suficiente para sobreposição entre instâncias
+def slow_send(**kwargs):
+    time.sleep(0.01)
+    fake_send(**kwargs)
+
+# Duas instâncias consumindo a mesma fila não devem duplicar envios
+N_MESSAGES = 30
+SENT.clear()
+for i in range(N_MESSAGES):
+    schedule_mail(QUEUE_PATH, MAIL_TO, f'simultânea {i}', 'Mensagem compartilhada')
+runners = [
+    Thread(target=run_scheduler, args=(QUEUE_PATH,),
+           kwargs=dict(rate=1000, burst=10, run_until_empty=True, send_func=slow_send, mail_box=MAIL_BOX))
+    for _ in range(2)
+]
+start = time.monotonic()
+for runner in runners:
+    runner.start()
+for runner in runners:
+    runner.join()
+subjects = [s[2] for s in SENT]
+assert sorted(subjects) == sorted(f'simultânea {i}' for i in range(N_MESSAGES)), f'Envios duplicados ou ausentes: {len(subjects)} de {N_MESSAGES}'
+assert time.monotonic() - start < 2, 'Mensagens reservadas tratadas como entregas futuras pela outra instância'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+        2.5 Interrupções durante o envio
+---------------------------------------------------
+"""
+
+# Interrupção do processo com a mensagem reservada (exceção não tratada pelo agendador)
+def crashing_send(**kwargs):
+    raise KeyboardInterrupt
+
+SENT.clear()
+schedule_mail(QUEUE_PATH, MAIL_TO, 'interrompida', 'Mensagem interrompida')
+try:
+    run_scheduler(QUEUE_PATH, rate=100, run_until_empty=True, retry_delay=0.2, send_func=crashing_send)
+    raise AssertionError('Interrupção deveria ser propagada')
+except KeyboardInterrupt:
+    pass
+conn = sqlite3.connect(QUEUE_PATH)
+assert conn.execute('SELECT attempts FROM pending').fetchone()[0] == 1, 'Reserva interrompida não contabilizada como tentativa'
+conn.close()
+
+# Mensagem reservada ignorada até a expiração da reserva e enviada em seguida
+assert run_scheduler(QUEUE_PATH, rate=100, run_until_empty=True, send_func=fake_send, mail_box=MAIL_BOX) == 0, 'Mensagem reservada não deveria ser enviada'
+time.sleep(0.25)
+assert run_scheduler(QUEUE_PATH, rate=100, run_until_empty=True, send_func=fake_send, mail_box=MAIL_BOX) == 1, 'Mensagem não liberada após expiração da reserva'
+assert [s[2] for s in SENT] == ['interrompida'], f'Envios inesperados: {SENT}'
+
+# Reservas interrompidas no limite de tentativas descartam a mensagem
+schedule_mail(QUEUE_PATH, MAIL_TO, 'descartada', 'Mensagem interrompida')
+try:
+    run_scheduler(QUEUE_PATH, rate=100, run_until_empty=True, retry_delay=0.05, send_func=crashing_send)
+except KeyboardInterrupt:
+    pass
+time.sleep(0.1)
+assert run_scheduler(QUEUE_PATH, rate=100, run_until_empty=True, max_attempts=1, send_func=fake_send, mail_box=MAIL_BOX) == 0, 'Mensagem no limite de tentativas não deveria ser enviada'
+conn = sqlite3.connect(QUEUE_PATH)
+assert conn.execute('SELECT COUNT(*) FROM pending').fetchone()[0] == 0, 'Mensagem no limite de tentativas deveria ser descartada'
+conn.close()
+os.remove(QUEUE_PATH)
+
+# Filas criadas sem a coluna de reserva continuam utilizáveis
+conn = sqlite3.connect(QUEUE_PATH)
+conn.execute('CREATE TABLE pending (id INTEGER PRIMARY KEY AUTOINCREMENT, deliver_at REAL NOT NULL, '
+             'attempts INTEGER NOT NULL DEFAULT 0, message TEXT NOT NULL)')
+conn.commit()
+conn.close()
+schedule_mail(QUEUE_PATH, MAIL_TO, 'fila antiga', 'Mensagem em fila antiga')
+assert run_scheduler(QUEUE_PATH, rate=100, run_until_empty=True, send_func=fake_send, mail_box=MAIL_BOX) == 1, 'Fila antiga não migrada'
+os.remove(QUEUE_PATH)
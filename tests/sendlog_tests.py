@@ -0,0 +1,162 @@
+"""
+---------------------------------------------------
+--------------- TESTS: sendlog_tests --------------
+---------------------------------------------------
+
+
+Table of Contents
+---------------------------------------------------
+1. Configurações iniciais
+    1.1 Importando bibliotecas
+    1.2 Iniciando servidor EWS local
+2. Testando funcionalidades
+    2.1 Chave de idempotência
+    2.2 Envios ignorados dentro da janela
+    2.3 Expiração da janela e limpeza do log
+    2.4 Falhas de envio
+---------------------------------------------------
+"""
+
+# Author: Thiago Panini
+# Date: 19/10/2026
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+            1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Funcionalidades
+from jaiminho.exchange import send_mail
+from jaiminho.mock_server import start_mock_ews_server
+from jaiminho.sendlog import message_key, open_send_log, was_sent, \
+                             record_send, prune_send_log
+
+# Bibliotecas padrão
+import os
+import tempfile
+import time
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÕES INICIAIS ------------
+        1.2 Iniciando servidor EWS local
+---------------------------------------------------
+"""
+
+# Servidor local e log de envios temporário
+server = start_mock_ews_server()
+SEND_LOG = os.path.join(tempfile.mkdtemp(), 'jaiminho_send_log.db')
+CREDENTIALS = {
+    'username': 'jaiminho',
+    'password': 'tangamandapio',
+    'server': server.url
+}
+MAIL_BOX = 'jaiminho@tangamandapio.com'
+MAIL_TO = ['chaves@tangamandapio.com', 'quico@tangamandapio.com']
+SUBJECT = '[Jaiminho] sendlog_tests.py - Log de envios'
+BODY = 'Mensagem enviada uma única vez'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+            2.1 Chave de idempotência
+---------------------------------------------------
+"""
+
+# Ordem e caixa dos endereços desconsideradas
+key = message_key(MAIL_BOX, MAIL_TO, SUBJECT, BODY, [('a.txt', b'jaiminho')])
+assert key == message_key(MAIL_BOX.upper(), MAIL_TO[::-1], SUBJECT, BODY, [('a.txt', b'jaiminho')]), 'Chave deveria ignorar ordem e caixa dos endereços'
+
+# Caixa remetente, corpo e anexos diferenciam mensagens
+assert key != message_key('seu.madruga@tangamandapio.com', MAIL_TO, SUBJECT, BODY, [('a.txt', b'jaiminho')]), 'Caixa remetente deveria compor a chave'
+assert key != message_key(MAIL_BOX, MAIL_TO, SUBJECT, BODY + '!', [('a.txt', b'jaiminho')]), 'Corpo deveria compor a chave'
+assert key != message_key(MAIL_BOX, MAIL_TO, SUBJECT, BODY, [('a.txt', b'jaiminho!')]), 'Conteúdo dos anexos deveria compor a chave'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+       2.2 Envios ignorados dentro da janela
+---------------------------------------------------
+"""
+
+# Primeiro envio realizado e registrado no log
+send_mail(mail_box=MAIL_BOX, mail_to=MAIL_TO, subject=SUBJECT, body=BODY,
+          zip_attachments=zip(['a.txt'], [b'jaiminho']), send_log=SEND_LOG, **CREDENTIALS)
+requests = server.requests
+assert requests > 0, 'Primeiro envio não chegou ao servidor'
+
+# Reexecução ignorada sem conexão ao servidor
+send_mail(mail_box=MAIL_BOX, mail_to=MAIL_TO, subject=SUBJECT, body=BODY,
+          zip_attachments=zip(['a.txt'], [b'jaiminho']), send_log=SEND_LOG, **CREDENTIALS)
+assert server.requests == requests, 'Envio duplicado deveria ser ignorado'
+
+# Mesmo conteúdo enviado a partir de outra caixa com o mesmo log
+send_mail(mail_box='seu.madruga@tangamandapio.com', mail_to=MAIL_TO, subject=SUBJECT, body=BODY,
+          zip_attachments=zip(['a.txt'], [b'jaiminho']), send_log=SEND_LOG, **CREDENTIALS)
+assert server.requests > requests, 'Envio a partir de outra caixa não deveria ser ignorado'
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+     2.3 Expiração da janela e limpeza do log
+---------------------------------------------------
+"""
+
+# Registro antigo considerado apenas sem janela ou em janelas maiores
+log = open_send_log(SEND_LOG)
+old_key = message_key(MAIL_BOX, MAIL_TO, 'Mensagem antiga', BODY)
+record_send(log, old_key)
+with log:
+    log.execute('UPDATE send_log SET sent_at = ? WHERE key = ?', (time.time() - 7200, old_key))
+assert was_sent(log, old_key), 'Registro deveria ser considerado sem janela de tempo'
+assert was_sent(log, old_key, window=86400), 'Registro deveria estar dentro da janela de um dia'
+assert not was_sent(log, old_key, window=3600), 'Registro deveria estar fora da janela de uma hora'
+
+# Limpeza remove apenas registros fora da janela mantida
+assert prune_send_log(log, window=3600) == 1, 'Apenas o registro antigo deveria ser removido'
+assert not was_sent(log, old_key), 'Registro antigo deveria ter sido removido do log'
+assert was_sent(log, key, window=3600), 'Registros recentes deveriam ser mantidos no log'
+assert log.execute('SELECT COUNT(*) FROM send_log').fetchone()[0] == 2, 'Log deveria conter os dois envios recentes'
+log.close()
+
+
+"""
+---------------------------------------------------
+----------- 2. TESTANDO FUNCIONALIDADES -----------
+              2.4 Falhas de envio
+---------------------------------------------------
+"""
+
+# Arquivos abertos pelo processo que apontam para o log de envios (Linux)
+def open_log_files():
+    if not os.path.isdir('/proc/self/fd'):
+        return 0
+    paths = []
+    for fd in os.listdir('/proc/self/fd'):
+        try:
+            paths.append(os.readlink(f'/proc/self/fd/{fd}'))
+        except OSError:
+            pass
+    return sum(path == os.path.realpath(SEND_LOG) for path in paths)
+
+# Falhas anteriores ao envio (caixa inválida) não registram o envio nem mantêm o log aberto
+try:
+    send_mail(mail_box='caixa-invalida', mail_to=MAIL_TO, subject='Falha no envio', body=BODY,
+              send_log=SEND_LOG, **CREDENTIALS)
+    raise AssertionError('Caixa inválida deveria gerar erro')
+except ValueError:
+    pass
+assert open_log_files() == 0, 'Log de envios mantido aberto após falha no envio'
+log = open_send_log(SEND_LOG)
+assert not was_sent(log, message_key('caixa-invalida', MAIL_TO, 'Falha no envio', BODY)), 'Envio com falha não deveria ser registrado'
+log.close()
+os.remove(SEND_LOG)
+server.shutdown()
+server.server_close()